@@ -0,0 +1,282 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ====================================================================================================
+# PANEL DE BARRIDO (¿QUE PASA SI?)
+# ====================================================================================================
+# Ventana para comparar escenarios sin volver a escribir los datos: se eligen rangos de λ, μ y c, la superficie de
+# métricas se precalcula en un hilo de trabajo (superficie.py) y los deslizadores actualizan las métricas, las curvas
+# de Ws / Wq contra λ y el mapa de calor de Wq solo con consultas e interpolación sobre la malla.
+#
+# Las curvas y las marcas son artistas animados: al mover λ o μ solo se redibujan ellas con blitting (como en
+# grafica.py). El dibujo completo solo ocurre al cambiar c, porque cambian el mapa y la escala de las curvas.
+
+import queue
+import threading
+import numpy as np
+import customtkinter as ctk
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib import colormaps
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+from superficie import SuperficieMetricas
+
+
+INTERVALO_SONDEO_MS = 50
+MAPA_COLOR = colormaps["viridis"].with_extremes(bad='#d9d9d9')
+
+
+# ====================================================================================================
+# PANEL DE BARRIDO
+# ====================================================================================================
+class PanelBarrido(ctk.CTkToplevel):
+    def __init__(self, parent, lambd=None, mu=None, s=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.title("Barrido de parámetros (¿qué pasa si?)")
+        self.geometry("1150x720")
+
+        self.superficie = None
+        self._cola = queue.Queue()
+        self._calculo_id = 0
+        self._c_mapa = None
+
+        # Rangos iniciales alrededor del escenario de la ventana principal (si lo hay).
+        lambd = lambd or 5.0
+        mu = mu or 3.0
+        s = s or 2
+
+        self._crear_rangos(lambd, mu, s)
+        self._crear_deslizadores()
+        self._crear_grafica()
+        self.precalcular()
+
+    # _crear_rangos: Campos de mínimo y máximo para λ, μ y c, y el botón para precalcular la superficie.
+    def _crear_rangos(self, lambd, mu, s):
+        frame = ctk.CTkFrame(self, corner_radius=10)
+        frame.pack(fill="x", padx=10, pady=(10, 5))
+
+        ctk.CTkLabel(frame, text="Rangos", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, padx=10, pady=5, sticky="w")
+        self.entradas_rango = {}
+        valores = {"λ": (lambd / 4, lambd * 2), "μ": (mu / 2, mu * 2), "c": (max(1, s - 3), s + 6)}
+
+        for columna, (nombre, (minimo, maximo)) in enumerate(valores.items()):
+            ctk.CTkLabel(frame, text=f"{nombre} mín / máx:").grid(row=0, column=3 * columna + 1, padx=(15, 5), pady=5)
+            entrada_min = ctk.CTkEntry(frame, width=70)
+            entrada_max = ctk.CTkEntry(frame, width=70)
+            entrada_min.insert(0, f"{minimo:g}")
+            entrada_max.insert(0, f"{maximo:g}")
+            entrada_min.grid(row=0, column=3 * columna + 2, padx=2, pady=5)
+            entrada_max.grid(row=0, column=3 * columna + 3, padx=2, pady=5)
+            self.entradas_rango[nombre] = (entrada_min, entrada_max)
+
+        self.boton_precalcular = ctk.CTkButton(frame, text="Precalcular", width=110, command=self.precalcular)
+        self.boton_precalcular.grid(row=0, column=10, padx=15, pady=5)
+
+        self.label_estado = ctk.CTkLabel(frame, text="")
+        self.label_estado.grid(row=0, column=11, padx=5, pady=5)
+
+    # _crear_deslizadores: Un deslizador por parámetro y las métricas interpoladas del punto elegido.
+    def _crear_deslizadores(self):
+        frame = ctk.CTkFrame(self, corner_radius=10)
+        frame.pack(fill="x", padx=10, pady=5)
+        frame.grid_columnconfigure(1, weight=1)
+
+        self.deslizadores = {}
+        self.labels_parametro = {}
+        for fila, nombre in enumerate(("λ", "μ", "c")):
+            ctk.CTkLabel(frame, text=f"{nombre}:", width=30).grid(row=fila, column=0, padx=10, pady=4)
+            deslizador = ctk.CTkSlider(frame, from_=0, to=1, command=self._al_mover)
+            deslizador.grid(row=fila, column=1, padx=10, pady=4, sticky="ew")
+            deslizador.configure(state="disabled")
+            etiqueta = ctk.CTkLabel(frame, text="---", width=80)
+            etiqueta.grid(row=fila, column=2, padx=10, pady=4)
+            self.deslizadores[nombre] = deslizador
+            self.labels_parametro[nombre] = etiqueta
+
+        self.label_metricas = ctk.CTkLabel(frame, text="", font=ctk.CTkFont(family="Courier", size=14), anchor="w")
+        self.label_metricas.grid(row=3, column=0, columnspan=3, padx=10, pady=(4, 8), sticky="w")
+
+    # _crear_grafica: Curvas de Ws y Wq contra λ (izquierda) y mapa de calor de Wq sobre λ × μ (derecha).
+    def _crear_grafica(self):
+        self.figura = Figure(figsize=(10, 4), facecolor='white')
+        self.ax_curvas = self.figura.add_subplot(121)
+        self.ax_mapa = self.figura.add_subplot(122)
+
+        self.linea_Ws, = self.ax_curvas.plot([], [], color='#4A90E2', label='Ws', animated=True)
+        self.linea_Wq, = self.ax_curvas.plot([], [], color='#E2904A', label='Wq', animated=True)
+        self.marca_lambda = self.ax_curvas.axvline(0, color='black', linestyle='--', linewidth=0.8, animated=True)
+        self.ax_curvas.set_xlabel('λ (tasa de llegada)')
+        self.ax_curvas.set_ylabel('tiempo esperado')
+        self.ax_curvas.set_yscale('log')
+        self.ax_curvas.set_ylim(1e-3, 1)
+        self.ax_curvas.grid(True, linestyle='--', alpha=0.4)
+        self.ax_curvas.legend(loc='upper left')
+
+        self.imagen_mapa = None
+        self.marca_mapa, = self.ax_mapa.plot([], [], marker='o', color='white', markeredgecolor='black', animated=True)
+        self._animados = (self.linea_Ws, self.linea_Wq, self.marca_lambda, self.marca_mapa)
+        self._fondo = None
+        self.ax_mapa.set_xlabel('μ (tasa de servicio)')
+        self.ax_mapa.set_ylabel('λ (tasa de llegada)')
+
+        self.figura.tight_layout()
+        self.canvas = FigureCanvasTkAgg(self.figura, master=self)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=(5, 10))
+        self.canvas.mpl_connect("draw_event", self._al_dibujar)
+
+    # precalcular: Lee los rangos y construye la superficie en un hilo de trabajo; la ventana sigue respondiendo.
+    def precalcular(self):
+        try:
+            rangos = {nombre: (float(minimo.get()), float(maximo.get())) for nombre, (minimo, maximo) in self.entradas_rango.items()}
+        except ValueError:
+            self.label_estado.configure(text="Rangos no numéricos.")
+            return
+
+        self._calculo_id += 1
+        self.boton_precalcular.configure(state="disabled", text="Calculando...")
+        self.label_estado.configure(text="")
+        hilo = threading.Thread(target=self._trabajo_superficie, args=(self._calculo_id, rangos), daemon=True)
+        hilo.start()
+        self.after(INTERVALO_SONDEO_MS, self._revisar_superficie)
+
+    def _trabajo_superficie(self, calculo_id, rangos):
+        try:
+            superficie = SuperficieMetricas(rangos["λ"], rangos["μ"], rangos["c"])
+            self._cola.put((calculo_id, superficie))
+        except (ValueError, MemoryError) as error:
+            self._cola.put((calculo_id, f"Error: {error}"))
+
+    # _revisar_superficie: Sondea la cola con after() y descarta superficies de rangos viejos.
+    def _revisar_superficie(self):
+        if not self.winfo_exists():
+            return
+        try:
+            calculo_id, superficie = self._cola.get_nowait()
+        except queue.Empty:
+            self.after(INTERVALO_SONDEO_MS, self._revisar_superficie)
+            return
+
+        if calculo_id != self._calculo_id:
+            self.after(INTERVALO_SONDEO_MS, self._revisar_superficie)
+            return
+
+        self.boton_precalcular.configure(state="normal", text="Precalcular")
+        if isinstance(superficie, str):
+            self.label_estado.configure(text=superficie)
+            return
+
+        self.superficie = superficie
+        self.label_estado.configure(text=f"{superficie.metricas['Wq'].size:,} puntos")
+        self._configurar_deslizadores()
+        self._c_mapa = None
+        self._al_mover()
+
+    # _configurar_deslizadores: Ajusta cada deslizador al rango de la malla (c en pasos enteros) y lo centra.
+    def _configurar_deslizadores(self):
+        mallas = {"λ": self.superficie.lambdas, "μ": self.superficie.mus, "c": self.superficie.servidores}
+        for nombre, malla in mallas.items():
+            minimo, maximo = float(malla[0]), float(malla[-1])
+            pasos = int(maximo - minimo) if nombre == "c" else None
+            deslizador = self.deslizadores[nombre]
+            deslizador.configure(state="normal", from_=minimo, to=max(maximo, minimo + 1e-9), number_of_steps=pasos or None)
+            deslizador.set(malla[len(malla) // 2])
+
+        self.ax_curvas.set_xlim(*_limites(self.superficie.lambdas))
+
+    # _al_mover: Lee los deslizadores y actualiza etiquetas, curvas y marcas con consultas a la superficie.
+    def _al_mover(self, *args):
+        if self.superficie is None:
+            return
+
+        lambd = self.deslizadores["λ"].get()
+        mu = self.deslizadores["μ"].get()
+        s = int(round(self.deslizadores["c"].get()))
+
+        self.labels_parametro["λ"].configure(text=f"{lambd:.3f}")
+        self.labels_parametro["μ"].configure(text=f"{mu:.3f}")
+        self.labels_parametro["c"].configure(text=f"{s}")
+
+        valores = {metrica: float(self.superficie.interpolar(metrica, lambd, mu, s)) for metrica in ("rho", "Ls", "Lq", "Ws", "Wq")}
+        if np.isnan(valores["Wq"]):
+            self.label_metricas.configure(text=f"ρ = {lambd / (s * mu):.4f}   El sistema colapsa (ρ ≥ 1) o está en el borde de la malla.")
+        else:
+            self.label_metricas.configure(text="   ".join(
+                f"{nombre} = {valores[clave]:.4f}"
+                for nombre, clave in (("ρ", "rho"), ("Ls", "Ls"), ("Lq", "Lq"), ("Ws", "Ws"), ("Wq", "Wq"))
+            ))
+
+        x, Ws = self.superficie.curva_lambda("Ws", mu, s)
+        _, Wq = self.superficie.curva_lambda("Wq", mu, s)
+        self.linea_Ws.set_data(x, Ws)
+        self.linea_Wq.set_data(x, Wq)
+        self.marca_lambda.set_xdata([lambd, lambd])
+        self.marca_mapa.set_data([mu], [lambd])
+
+        if s != self._c_mapa or self._fondo is None:
+            self._dibujar_mapa(s)
+            self._ajustar_escala_curvas(s)
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._fondo)
+            self._dibujar_animados()
+            self.canvas.blit(self.figura.bbox)
+
+    # _ajustar_escala_curvas: Escala logarítmica del eje y con los valores finitos y positivos de Ws y Wq de toda la
+    # rebanada de c (todas las μ), para que mover μ no obligue a cambiar la escala.
+    def _ajustar_escala_curvas(self, s):
+        valores = np.concatenate((self.superficie.mapa("Ws", s).ravel(), self.superficie.mapa("Wq", s).ravel()))
+        valores = valores[np.isfinite(valores) & (valores > 0)]
+        if len(valores):
+            self.ax_curvas.set_ylim(max(valores.min(), valores.max() * 1e-6) / 1.5, valores.max() * 1.5)
+
+    # _al_dibujar: Después de un dibujo completo guarda el fondo (sin curvas ni marcas) y las pinta encima.
+    def _al_dibujar(self, evento):
+        self._fondo = self.canvas.copy_from_bbox(self.figura.bbox)
+        self._dibujar_animados()
+
+    def _dibujar_animados(self):
+        for artista in self._animados:
+            self.figura.draw_artist(artista)
+
+    # _dibujar_mapa: Cambia la imagen del mapa de calor de Wq cuando cambia c (λ y μ solo mueven la marca).
+    def _dibujar_mapa(self, s):
+        mapa = np.ma.masked_invalid(self.superficie.mapa("Wq", s))
+        mapa = np.ma.masked_less_equal(mapa, 0)
+        extension = (*_limites(self.superficie.mus), *_limites(self.superficie.lambdas))
+        norma = LogNorm(vmin=mapa.min(), vmax=mapa.max()) if mapa.count() else None
+
+        if self.imagen_mapa is None:
+            self.imagen_mapa = self.ax_mapa.imshow(mapa, origin='lower', aspect='auto', extent=extension, cmap=MAPA_COLOR, norm=norma)
+            self.barra_color = self.figura.colorbar(self.imagen_mapa, ax=self.ax_mapa, label='Wq')
+        else:
+            self.imagen_mapa.set_data(mapa)
+            self.imagen_mapa.set_extent(extension)
+            if norma is not None:
+                self.imagen_mapa.set_norm(norma)
+        self.ax_mapa.set_title(f'Wq con c = {s} (gris: inestable)', fontsize=11)
+        self._c_mapa = s
+
+
+# _limites: Extremos de una malla; si tiene un solo punto se abre medio paso a cada lado para no tener un eje vacío.
+def _limites(malla):
+    if malla[-1] > malla[0]:
+        return float(malla[0]), float(malla[-1])
+    return float(malla[0]) - 0.5, float(malla[0]) + 0.5
@@ -0,0 +1,240 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# PRUEBAS DE RENDIMIENTO [MODELO MM1 - MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Medir la latencia de un solo punto de mm1_metrics y mmc_metrics.
+#   - Medir el rendimiento en lote (puntos/s) de mmc_metrics_batch con c ∈ {1, 10, 100, 1000}.
+#   - Medir la generación de Pn hasta n_max grandes.
+#   - Medir el dibujo completo y el blitting de la gráfica de Pn (sin ventana, con Agg).
+#   - Guardar los resultados en JSON y compararlos contra una corrida base, marcando
+#     como regresión todo lo que sea más lento que la base por encima de un umbral.
+#
+# Ejemplos:
+#   python benchmark.py --salida base.json
+#   python benchmark.py --base base.json --umbral 0.15 --salida actual.json
+#   python benchmark.py --rapido --filtro grafica
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+import numpy as np
+from utils import mm1_metrics, mmc_metrics, mm1_metrics_batch, mmc_metrics_batch, pn_arreglo
+
+
+SERVIDORES_LOTE = (1, 10, 100, 1000)
+
+
+# ====================================================================================================
+# MEDIR
+# ====================================================================================================
+# medir: Ejecuta la función en repeticiones de `numero` llamadas. Si numero es None se ajusta (como timeit.autorange)
+# hasta que una repetición dure al menos tiempo_minimo. Regresa segundos por llamada (mediana, mínimo y máximo).
+def medir(funcion, repeticiones=7, numero=None, tiempo_minimo=0.05):
+    funcion()
+    if numero is None:
+        numero = 1
+        while True:
+            inicio = time.perf_counter()
+            for _ in range(numero):
+                funcion()
+            if time.perf_counter() - inicio >= tiempo_minimo:
+                break
+            numero *= 2
+
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for _ in range(numero):
+            funcion()
+        tiempos.append((time.perf_counter() - inicio) / numero)
+
+    return {
+        "mediana_s": statistics.median(tiempos),
+        "min_s": min(tiempos),
+        "max_s": max(tiempos),
+        "repeticiones": repeticiones,
+        "llamadas_por_repeticion": numero
+    }
+
+# ====================================================================================================
+# CASOS DE PRUEBA
+# ====================================================================================================
+# casos: Regresa una lista de (nombre, función, elementos por llamada). Con elementos se reporta también el
+# rendimiento (elementos/s). Los nombres son estables para poder comparar corridas.
+def casos(rapido=False):
+    lista = [
+        ("punto/mm1_metrics", lambda: mm1_metrics(2, 3, 10), None),
+        ("punto/mmc_metrics c=2", lambda: mmc_metrics(5, 3, 2, 10), None),
+        ("punto/mmc_metrics c=100", lambda: mmc_metrics(95, 1, 100, 10), None),
+    ]
+
+    puntos = 1_000 if rapido else 10_000
+    rng = np.random.default_rng(0)
+    for c in SERVIDORES_LOTE:
+        lambd = rng.uniform(0.1, 0.95, puntos) * c
+        lista.append((f"lote/mmc_metrics_batch c={c}", lambda lambd=lambd, c=c: mmc_metrics_batch(lambd, 1.0, c, 0), puntos))
+    lambd = rng.uniform(0.1, 0.95, puntos)
+    lista.append(("lote/mm1_metrics_batch", lambda: mm1_metrics_batch(lambd, 1.0, 0), puntos))
+
+    for n_max in ((1_000, 100_000) if rapido else (1_000, 100_000, 1_000_000)):
+        lista.append((f"pn/pn_arreglo c=10 n_max={n_max}", lambda n_max=n_max: pn_arreglo(9.5, 1, 10, n_max), n_max + 1))
+        lista.append((f"pn/mmc_metrics c=10 n_max={n_max}", lambda n_max=n_max: mmc_metrics(9.5, 1, 10, n_max), n_max + 1))
+
+    lista.extend(_casos_grafica(rapido))
+    return lista
+
+# _casos_grafica: Dibujo completo y blitting de GraficaPn sobre un FigureCanvasAgg. Se omiten si no hay matplotlib.
+def _casos_grafica(rapido):
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from grafica import GraficaPn
+    except ImportError:
+        return []
+
+    lista = []
+    for n_max in ((10, 10_000) if rapido else (10, 1_000, 100_000)):
+        Pn = np.asarray(mmc_metrics(1.8, 1, 2, n_max)["Pn"])
+        casi_igual = Pn * 1.01
+        grafica = GraficaPn()
+        grafica.conectar(FigureCanvasAgg(grafica.figura))
+
+        # Olvidar la forma anterior obliga a actualizar() a tomar el camino del dibujo completo.
+        def completo(grafica=grafica, Pn=Pn):
+            grafica._forma = None
+            grafica.actualizar(Pn)
+
+        def incremental(grafica=grafica, Pn=Pn, casi_igual=casi_igual):
+            grafica.actualizar(casi_igual)
+            grafica.actualizar(Pn)
+
+        lista.append((f"grafica/dibujo completo n_max={n_max}", completo, None))
+        lista.append((f"grafica/blitting x2 n_max={n_max}", incremental, None))
+    return lista
+
+# ====================================================================================================
+# CORRER
+# ====================================================================================================
+# correr: Mide todos los casos cuyo nombre contiene el filtro y regresa el documento JSON de resultados.
+def correr(rapido=False, filtro=None, repeticiones=7, salida_progreso=sys.stderr):
+    resultados = {}
+    for nombre, funcion, elementos in casos(rapido):
+        if filtro and filtro not in nombre:
+            continue
+        medicion = medir(funcion, repeticiones, tiempo_minimo=0.02 if rapido else 0.05)
+        if elementos:
+            medicion["elementos_por_s"] = elementos / medicion["mediana_s"]
+        resultados[nombre] = medicion
+        if salida_progreso is not None:
+            print(f"{nombre:<45} {_formato_tiempo(medicion['mediana_s']):>12}", file=salida_progreso)
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "entorno": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "procesador": platform.processor()
+        },
+        "rapido": rapido,
+        "resultados": resultados
+    }
+
+# ====================================================================================================
+# COMPARAR CONTRA LA BASE
+# ====================================================================================================
+# comparar: Regresa una fila por caso presente en ambas corridas con la razón actual/base de las medianas.
+# Una razón mayor que 1 + umbral es una regresión; menor que 1 / (1 + umbral), una mejora.
+def comparar(actual, base, umbral=0.10):
+    filas = []
+    for nombre, medicion in actual["resultados"].items():
+        anterior = base["resultados"].get(nombre)
+        if anterior is None:
+            continue
+        razon = medicion["mediana_s"] / anterior["mediana_s"]
+        if razon > 1 + umbral:
+            estado = "REGRESION"
+        elif razon < 1 / (1 + umbral):
+            estado = "mejora"
+        else:
+            estado = "igual"
+        filas.append({
+            "caso": nombre,
+            "base_s": anterior["mediana_s"],
+            "actual_s": medicion["mediana_s"],
+            "razon": razon,
+            "estado": estado
+        })
+    return filas
+
+def _formato_tiempo(segundos):
+    for unidad, escala in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if segundos >= escala:
+            return f"{segundos / escala:.3f} {unidad}"
+    return f"{segundos / 1e-9:.1f} ns"
+
+
+# ====================================================================================================
+# FUNCION MAIN PARA PRUEBAS DE RENDIMIENTO
+# ====================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pruebas de rendimiento de los motores de métricas y de la gráfica.")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados.")
+    parser.add_argument("--base", help="Archivo JSON de una corrida anterior para comparar.")
+    parser.add_argument("--umbral", type=float, default=0.10, help="Aumento relativo tolerado antes de marcar regresión.")
+    parser.add_argument("--repeticiones", type=int, default=7, help="Repeticiones por caso (se reporta la mediana).")
+    parser.add_argument("--filtro", help="Solo correr los casos cuyo nombre contiene este texto.")
+    parser.add_argument("--rapido", action="store_true", help="Tamaños reducidos para una revisión rápida.")
+    args = parser.parse_args(argv)
+
+    actual = correr(args.rapido, args.filtro, args.repeticiones)
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(actual, archivo, ensure_ascii=False, indent=2)
+
+    if not args.base:
+        return 0
+
+    with open(args.base, encoding="utf-8") as archivo:
+        base = json.load(archivo)
+
+    filas = comparar(actual, base, args.umbral)
+    print(f"\n{'caso':<45} {'base':>12} {'actual':>12} {'razón':>7}")
+    for fila in filas:
+        print(f"{fila['caso']:<45} {_formato_tiempo(fila['base_s']):>12} {_formato_tiempo(fila['actual_s']):>12} "
+              f"{fila['razon']:>6.2f}x  {fila['estado']}")
+
+    regresiones = [fila for fila in filas if fila["estado"] == "REGRESION"]
+    if regresiones:
+        print(f"\n{len(regresiones)} regresión(es) por encima del {args.umbral:.0%}.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# CACHE DE METRICAS [MODELO MM1 - MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Guardar en una caché LRU acotada los resultados de mm1_metrics y mmc_metrics.
+#   - Reutilizar un vector Pn más largo recortándolo cuando se pide un n_max menor.
+#   - Llevar estadísticas de aciertos y fallos.
+
+from collections import OrderedDict
+from threading import Lock
+from utils import mm1_metrics, mmc_metrics
+
+
+# ====================================================================================================
+# CACHE LRU DE METRICAS
+# ====================================================================================================
+class CacheMetricas:
+    def __init__(self, max_entradas=256):
+        self.max_entradas = max_entradas
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._candado = Lock()
+
+    # obtener: Regresa las métricas del modelo (MM1 si s es None). La llave no incluye n_max: se guarda
+    # el resultado con el Pn más largo calculado y se recorta para peticiones con n_max menor.
+    def obtener(self, lambd, mu, s, n_max):
+        llave = _normalizar(lambd, mu, s)
+        lambd, mu, s = llave
+
+        with self._candado:
+            guardado = self._entradas.get(llave)
+            if guardado is not None and (isinstance(guardado, str) or len(guardado["Pn"]) > n_max):
+                self._entradas.move_to_end(llave)
+                self.aciertos += 1
+                return _recortar(guardado, n_max)
+            self.fallos += 1
+
+        if s is None:
+            resultado = mm1_metrics(lambd, mu, n_max)
+        else:
+            resultado = mmc_metrics(lambd, mu, s, n_max)
+
+        # Otro hilo pudo guardar la misma llave mientras se calculaba; se conserva la entrada con más Pn.
+        with self._candado:
+            guardado = self._entradas.get(llave)
+            if guardado is None or isinstance(guardado, str) or len(guardado["Pn"]) < len(resultado["Pn"]):
+                self._entradas[llave] = resultado
+            self._entradas.move_to_end(llave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+
+        return _recortar(resultado, n_max)
+
+    # info: Estadísticas de uso de la caché.
+    def info(self):
+        with self._candado:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas
+            }
+
+    # limpiar: Vacía la caché y reinicia las estadísticas.
+    def limpiar(self):
+        with self._candado:
+            self._entradas.clear()
+            self.aciertos = 0
+            self.fallos = 0
+
+
+# _normalizar: Llave de la caché; trata 2, 2.0 y "2" como el mismo parámetro. obtener calcula con estos mismos valores
+# (λ y μ flotantes, c entero), así que la llave y el resultado siempre coinciden.
+def _normalizar(lambd, mu, s):
+    return (float(lambd), float(mu), None if s is None else int(s))
+
+# _recortar: Copia del resultado con Pn limitado a n_max (los errores se regresan tal cual).
+def _recortar(resultado, n_max):
+    if isinstance(resultado, str):
+        return resultado
+    copia = dict(resultado)
+    copia["Pn"] = resultado["Pn"][:max(n_max + 1, 0)]
+    return copia
+
+
+# ====================================================================================================
+# CACHE COMPARTIDA
+# ====================================================================================================
+cache_metricas = CacheMetricas()
+
+def mm1_metrics_cache(lambd, mu, n_max):
+    return cache_metricas.obtener(lambd, mu, None, n_max)
+
+def mmc_metrics_cache(lambd, mu, s, n_max):
+    return cache_metricas.obtener(lambd, mu, s, n_max)
@@ -0,0 +1,146 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# PLANEACION DE CAPACIDAD [MODELO MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Encontrar el menor número de servidores c que cumple un objetivo de servicio.
+#   - Encontrar la mayor tasa de llegada λ admisible para un número de servidores.
+#   - Resolver un día completo de pronósticos de λ por hora en una sola llamada.
+#
+# Objetivos disponibles (se pueden combinar; se deben cumplir todos):
+#   - wq_max: Wq ≤ wq_max.
+#   - ws_max: Ws ≤ ws_max.
+#   - p_espera_max: P(esperar) = Erlang-C ≤ p_espera_max.
+#   - nivel_servicio: (t, fraccion) tal que P(Wq ≤ t) ≥ fraccion.
+
+import numpy as np
+from utils import erlang_b
+
+
+# ====================================================================================================
+# MINIMO NUMERO DE SERVIDORES
+# ====================================================================================================
+# servidores_minimos: Recorre c = 1, 2, ... actualizando Erlang-B con su recurrencia, así que cada
+# candidato cuesta O(1) y no se recalcula nada desde cero. Las métricas solo mejoran al agregar
+# servidores, por lo que el primer c que cumple es el mínimo.
+def servidores_minimos(lambd, mu, wq_max=None, ws_max=None, p_espera_max=None, nivel_servicio=None, c_max=100_000):
+    error = _validar_objetivos(mu, wq_max, ws_max, p_espera_max, nivel_servicio)
+    if error:
+        return error
+
+    a = lambd / mu
+    B = 1.0
+    for c in range(1, c_max + 1):
+        aB = a * B
+        B = aB / (c + aB)
+        if c > a and _cumple(c, a, lambd, mu, B, wq_max, ws_max, p_espera_max, nivel_servicio):
+            return c
+
+    return f"\nERROR: Ningún c ≤ {c_max} cumple el objetivo."
+
+# ====================================================================================================
+# MAXIMA TASA DE LLEGADA ADMISIBLE
+# ====================================================================================================
+# lambda_maxima: Bisección sobre λ en (0, c·μ). Las métricas empeoran al crecer λ, así que el intervalo
+# [cumple, no cumple] se va cerrando hasta la tolerancia relativa indicada.
+def lambda_maxima(mu, s, wq_max=None, ws_max=None, p_espera_max=None, nivel_servicio=None, tol=1e-9):
+    error = _validar_objetivos(mu, wq_max, ws_max, p_espera_max, nivel_servicio)
+    if error:
+        return error
+
+    bajo, alto = 0.0, s * mu
+    while alto - bajo > tol * alto:
+        lambd = (bajo + alto) / 2
+        a = lambd / mu
+        if _cumple(s, a, lambd, mu, erlang_b(s, a), wq_max, ws_max, p_espera_max, nivel_servicio):
+            bajo = lambd
+        else:
+            alto = lambd
+
+    return bajo
+
+# ====================================================================================================
+# MINIMO NUMERO DE SERVIDORES EN LOTE
+# ====================================================================================================
+# servidores_minimos_lote: Igual que servidores_minimos pero para un arreglo de pronósticos de λ
+# (por ejemplo las 24 horas de un día). La recurrencia de Erlang-B avanza para todos los puntos a la
+# vez y cada punto se congela en cuanto encuentra su c mínimo.
+def servidores_minimos_lote(lambdas, mu, wq_max=None, ws_max=None, p_espera_max=None, nivel_servicio=None, c_max=100_000):
+    error = _validar_objetivos(mu, wq_max, ws_max, p_espera_max, nivel_servicio)
+    if error:
+        return error
+
+    lambdas = np.asarray(lambdas, dtype=float)
+    a = lambdas / mu
+    B = np.ones(lambdas.shape)
+    resultado = np.zeros(lambdas.shape, dtype=np.int64)
+    pendientes = np.ones(lambdas.shape, dtype=bool)
+
+    for c in range(1, c_max + 1):
+        aB = a * B
+        B = aB / (c + aB)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            cumple = (c > a) & _cumple(c, a, lambdas, mu, B, wq_max, ws_max, p_espera_max, nivel_servicio)
+        nuevos = pendientes & cumple
+        resultado[nuevos] = c
+        pendientes &= ~nuevos
+        if not pendientes.any():
+            return resultado
+
+    return f"\nERROR: Ningún c ≤ {c_max} cumple el objetivo para todos los pronósticos."
+
+# ====================================================================================================
+# FUNCIONES AUXILIARES
+# ====================================================================================================
+# _cumple: Evalúa los objetivos con Erlang-C obtenido de Erlang-B. Funciona con escalares o arreglos.
+def _cumple(c, a, lambd, mu, B, wq_max, ws_max, p_espera_max, nivel_servicio):
+    C = c * B / (c - a * (1 - B))
+    holgura = c * mu - lambd
+    Wq = C / holgura
+    cumple = True
+
+    if wq_max is not None:
+        cumple = cumple & (Wq <= wq_max)
+    if ws_max is not None:
+        cumple = cumple & (Wq + 1 / mu <= ws_max)
+    if p_espera_max is not None:
+        cumple = cumple & (C <= p_espera_max)
+    if nivel_servicio is not None:
+        t, fraccion = nivel_servicio
+        cumple = cumple & (1 - C * np.exp(-holgura * t) >= fraccion)
+
+    return cumple
+
+# _validar_objetivos: Revisa que haya al menos un objetivo y que sea alcanzable con suficientes servidores.
+def _validar_objetivos(mu, wq_max, ws_max, p_espera_max, nivel_servicio):
+    if wq_max is None and ws_max is None and p_espera_max is None and nivel_servicio is None:
+        return "\nERROR: Indica al menos un objetivo (wq_max, ws_max, p_espera_max o nivel_servicio)."
+    if wq_max is not None and wq_max <= 0:
+        return "\nERROR: wq_max debe ser mayor que 0."
+    if ws_max is not None and ws_max <= 1 / mu:
+        return "\nERROR: ws_max debe ser mayor que el tiempo de servicio 1/μ."
+    if p_espera_max is not None and p_espera_max <= 0:
+        return "\nERROR: p_espera_max debe ser mayor que 0."
+    if nivel_servicio is not None and not (0 <= nivel_servicio[1] < 1):
+        return "\nERROR: La fracción del nivel de servicio debe estar en [0, 1)."
+    return None
@@ -0,0 +1,202 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# LINEA DE COMANDOS [MODELO MM1 - MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Calcular métricas sin interfaz gráfica (sin customtkinter, PIL ni matplotlib).
+#   - Leer escenarios desde argumentos, un CSV o un archivo JSON Lines.
+#   - Escribir las métricas en la salida estándar o en un archivo (CSV o JSON Lines), o en un
+#     directorio columnar .npy que se puede mapear en memoria (ver resultados.py).
+#
+# Ejemplos:
+#   python cli.py --modelo MMc --lambd 5 --mu 3 --servidores 2 --n-max 5
+#   python cli.py --csv escenarios.csv --formato csv --salida resultados.csv
+#   cat escenarios.jsonl | python cli.py --jsonl -
+#   python cli.py --csv escenarios.csv --formato npy --salida resultados_npy/
+
+import argparse
+import csv
+import json
+import sys
+from utils import mm1_metrics, mmc_metrics
+
+
+COLUMNAS = ("modelo", "lambd", "mu", "servidores", "n_max", "rho", "Ls", "Lq", "Ws", "Wq", "c_bar", "P0", "Pn", "error")
+
+
+# ====================================================================================================
+# LEER ESCENARIOS
+# ====================================================================================================
+# leer_escenarios: Regresa un iterador de diccionarios con los campos de cada escenario.
+def leer_escenarios(args):
+    if args.csv:
+        with _abrir(args.csv, "r") as archivo:
+            yield from csv.DictReader(archivo)
+    elif args.jsonl:
+        with _abrir(args.jsonl, "r") as archivo:
+            for linea in archivo:
+                if linea.strip():
+                    yield json.loads(linea)
+    else:
+        yield {
+            "modelo": args.modelo,
+            "lambd": args.lambd,
+            "mu": args.mu,
+            "servidores": args.servidores,
+            "n_max": args.n_max
+        }
+
+# ====================================================================================================
+# CALCULAR ESCENARIO
+# ====================================================================================================
+# calcular_escenario: Valida un escenario, llama a mm1_metrics o mmc_metrics y regresa una fila plana
+# con nombres de columna cortos. Los errores se reportan en la columna "error" en lugar de detener el lote.
+def calcular_escenario(escenario):
+    fila = dict.fromkeys(COLUMNAS)
+    try:
+        modelo = str(escenario.get("modelo") or "MM1").strip().upper()
+        lambd = float(escenario.get("lambd", escenario.get("lambda")))
+        mu = float(escenario["mu"])
+        n_max = int(escenario.get("n_max") or 0)
+        s = escenario.get("servidores", escenario.get("c"))
+        s = int(s) if s not in (None, "") else 1
+    except (KeyError, TypeError, ValueError):
+        fila["error"] = "ERROR: Algún dato no fue del tipo esperado..."
+        return fila
+
+    fila.update(modelo=modelo, lambd=lambd, mu=mu, servidores=s, n_max=n_max)
+
+    if n_max < 0:
+        fila["error"] = "ERROR: Se necesita n_max ≥ 0."
+        return fila
+    if modelo == "MMC" and s < 1:
+        fila["error"] = "ERROR: El modelo MMc necesita c ≥ 1."
+        return fila
+
+    try:
+        if modelo == "MM1":
+            resultado = mm1_metrics(lambd, mu, n_max)
+        elif modelo == "MMC":
+            fila["modelo"] = "MMc"
+            resultado = mmc_metrics(lambd, mu, s, n_max)
+        else:
+            fila["error"] = "ERROR: Modelo no reconocido. Usa MM1 o MMc."
+            return fila
+    except (ValueError, ZeroDivisionError, OverflowError) as error:
+        fila["error"] = f"ERROR: {error}"
+        return fila
+
+    if isinstance(resultado, str):
+        fila["error"] = resultado.strip()
+        return fila
+
+    for clave, valor in resultado.items():
+        fila[clave.split(" ")[0]] = valor
+    return fila
+
+# ====================================================================================================
+# ESCRIBIR RESULTADOS
+# ====================================================================================================
+def escribir_jsonl(filas, salida):
+    for fila in filas:
+        salida.write(json.dumps(fila, ensure_ascii=False) + "\n")
+
+def escribir_csv(filas, salida):
+    escritor = csv.DictWriter(salida, fieldnames=COLUMNAS, lineterminator="\n")
+    escritor.writeheader()
+    for fila in filas:
+        if fila["Pn"] is not None:
+            fila["Pn"] = " ".join(repr(p) for p in fila["Pn"])
+        escritor.writerow(fila)
+
+# escribir_npy: Guarda las filas sin error en un directorio columnar (EscritorColumnar). Se importa aquí para que los
+# formatos de texto no dependan de resultados.py.
+def escribir_npy(filas, directorio):
+    from resultados import EscritorColumnar, ResultadoColas
+
+    with EscritorColumnar(directorio) as escritor:
+        for fila in filas:
+            if fila["error"]:
+                continue
+            escritor.agregar(ResultadoColas(
+                fila["modelo"], fila["lambd"], fila["mu"], fila["servidores"] if fila["modelo"] == "MMc" else 1,
+                fila["rho"], fila["Ls"], fila["Lq"], fila["Ws"], fila["Wq"],
+                fila["rho"] if fila["c_bar"] is None else fila["c_bar"], fila["P0"], fila["Pn"]
+            ))
+
+# _abrir: Abre un archivo o usa stdin/stdout cuando la ruta es "-".
+def _abrir(ruta, modo):
+    if ruta == "-":
+        return open(sys.stdin.fileno() if "r" in modo else sys.stdout.fileno(), modo, encoding="utf-8", closefd=False)
+    return open(ruta, modo, encoding="utf-8", newline="")
+
+
+# ====================================================================================================
+# FUNCION MAIN PARA LINEA DE COMANDOS
+# ====================================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teoría de Colas MM1 / MMc sin interfaz gráfica.")
+    entrada = parser.add_mutually_exclusive_group()
+    entrada.add_argument("--csv", help="Archivo CSV con columnas modelo, lambd, mu, servidores, n_max ('-' = stdin).")
+    entrada.add_argument("--jsonl", help="Archivo JSON Lines con los mismos campos ('-' = stdin).")
+    parser.add_argument("--modelo", default="MM1", help="MM1 o MMc (escenario único).")
+    parser.add_argument("--lambd", type=float, help="Tasa de llegada λ.")
+    parser.add_argument("--mu", type=float, help="Tasa de servicio μ.")
+    parser.add_argument("--servidores", type=int, default=1, help="Número de servidores c (solo MMc).")
+    parser.add_argument("--n-max", dest="n_max", type=int, default=0, help="Probabilidades Pn a calcular.")
+    parser.add_argument("--formato", choices=("jsonl", "csv", "npy"), default="jsonl",
+                        help="Formato de salida (npy = directorio columnar mapeable en memoria).")
+    parser.add_argument("--salida", default="-", help="Archivo de salida ('-' = stdout) o directorio con --formato npy.")
+    args = parser.parse_args(argv)
+
+    if not (args.csv or args.jsonl) and (args.lambd is None or args.mu is None):
+        parser.error("indica --lambd y --mu, o un archivo con --csv / --jsonl")
+    if args.formato == "npy" and args.salida == "-":
+        parser.error("--formato npy necesita un directorio en --salida")
+
+    filas = (calcular_escenario(escenario) for escenario in leer_escenarios(args))
+    hubo_error = False
+
+    def revisar(filas):
+        nonlocal hubo_error
+        for fila in filas:
+            if fila["error"]:
+                hubo_error = True
+                print(fila["error"], file=sys.stderr)
+            yield fila
+
+    if args.formato == "npy":
+        escribir_npy(revisar(filas), args.salida)
+        return 1 if hubo_error else 0
+
+    with _abrir(args.salida, "w") as salida:
+        if args.formato == "csv":
+            escribir_csv(revisar(filas), salida)
+        else:
+            escribir_jsonl(revisar(filas), salida)
+
+    return 1 if hubo_error else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
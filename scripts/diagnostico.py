@@ -0,0 +1,112 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ====================================================================================================
+# PANEL DE DIAGNOSTICO
+# ====================================================================================================
+# Ventana pequeña para encender la instrumentación (tiempos, cProfile, tracemalloc), ver el resumen de
+# los tramos y contadores y exportarlo a JSON.
+
+import customtkinter as ctk
+from tkinter import filedialog
+from instrumentacion import instrumentacion
+
+
+# ====================================================================================================
+# FORMATO DEL RESUMEN
+# ====================================================================================================
+# formatear_resumen: Convierte el resumen de la instrumentación en texto de ancho fijo para el panel.
+def formatear_resumen(resumen):
+    lineas = [f"{'tramo':<18}{'llamadas':>9}{'último':>12}{'promedio':>12}{'máximo':>12}{'memoria':>12}"]
+    for nombre, tramo in resumen["tramos"].items():
+        memoria = tramo.get("pico_memoria_bytes")
+        lineas.append(
+            f"{nombre:<18}{tramo['llamadas']:>9}{tramo['ultimo_s'] * 1e3:>9.2f} ms{tramo['promedio_s'] * 1e3:>9.2f} ms"
+            f"{tramo['max_s'] * 1e3:>9.2f} ms{'' if memoria is None else f'{memoria / 1024:>9.1f} KB':>12}"
+        )
+    if not resumen["tramos"]:
+        lineas.append("(sin mediciones; activa la instrumentación y calcula)")
+
+    lineas.append("")
+    for nombre, valor in resumen["contadores"].items():
+        lineas.append(f"{nombre:<30}{valor:>12}")
+    for nombre, valor in resumen["valores"].items():
+        lineas.append(f"{nombre:<30}{valor['ultimo']:>12}   (máx. {valor['max']})")
+    for nombre, fuente in resumen.items():
+        if nombre not in ("tramos", "contadores", "valores") and isinstance(fuente, dict):
+            lineas.append(f"{nombre:<30}" + ", ".join(f"{clave}={valor}" for clave, valor in fuente.items()))
+
+    if "perfil" in resumen:
+        lineas += ["", resumen["perfil"]]
+    if "memoria" in resumen:
+        lineas += ["", "Mayores asignaciones (tracemalloc):"] + resumen["memoria"]
+    return "\n".join(lineas)
+
+# ====================================================================================================
+# PANEL DE DIAGNOSTICO
+# ====================================================================================================
+class PanelDiagnostico(ctk.CTkToplevel):
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.title("Diagnóstico")
+        self.geometry("900x560")
+
+        opciones = ctk.CTkFrame(self, fg_color="transparent")
+        opciones.pack(padx=10, pady=10, fill="x")
+
+        self.activa_var = ctk.BooleanVar(value=instrumentacion.activa)
+        self.perfil_var = ctk.BooleanVar(value=instrumentacion.perfilar)
+        self.memoria_var = ctk.BooleanVar(value=instrumentacion.memoria)
+
+        ctk.CTkSwitch(opciones, text="Medir tiempos", variable=self.activa_var, command=self._configurar).pack(side="left", padx=10)
+        ctk.CTkSwitch(opciones, text="cProfile", variable=self.perfil_var, command=self._configurar).pack(side="left", padx=10)
+        ctk.CTkSwitch(opciones, text="tracemalloc", variable=self.memoria_var, command=self._configurar).pack(side="left", padx=10)
+
+        ctk.CTkButton(opciones, text="Exportar…", width=90, command=self.exportar).pack(side="right", padx=5)
+        ctk.CTkButton(opciones, text="Limpiar", width=90, command=self.limpiar).pack(side="right", padx=5)
+        ctk.CTkButton(opciones, text="Actualizar", width=90, command=self.actualizar).pack(side="right", padx=5)
+
+        self.texto = ctk.CTkTextbox(self, font=ctk.CTkFont(family="Courier", size=13), wrap="none")
+        self.texto.pack(padx=10, pady=(0, 10), fill="both", expand=True)
+        self.actualizar()
+
+    # actualizar: Vuelve a leer el resumen y lo muestra.
+    def actualizar(self):
+        self.texto.configure(state="normal")
+        self.texto.delete("1.0", "end")
+        self.texto.insert("1.0", formatear_resumen(instrumentacion.resumen()))
+        self.texto.configure(state="disabled")
+
+    def limpiar(self):
+        instrumentacion.limpiar()
+        self.actualizar()
+
+    # exportar: Guarda el resumen completo en un archivo JSON elegido por el usuario.
+    def exportar(self):
+        ruta = filedialog.asksaveasfilename(parent=self, defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if ruta:
+            instrumentacion.exportar(ruta)
+
+    # _configurar: Aplica los interruptores; cProfile y tracemalloc encienden también la medición de tiempos.
+    def _configurar(self):
+        instrumentacion.configurar(self.activa_var.get(), self.perfil_var.get(), self.memoria_var.get())
+        self.activa_var.set(instrumentacion.activa)
+        self.actualizar()
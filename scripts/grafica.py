@@ -0,0 +1,157 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# GRAFICA DE PROBABILIDADES Pn
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Construir la figura de Pn una sola vez y actualizar las barras en su lugar.
+#   - Redibujar solo las barras con blitting cuando los ejes no cambian.
+#   - Agrupar distribuciones densas en a lo más MAX_BARRAS barras.
+#   - Omitir las etiquetas por barra cuando hay más de MAX_ETIQUETAS barras.
+#
+# No depende de Tk: la interfaz le conecta un FigureCanvasTkAgg y las pruebas de
+# rendimiento un FigureCanvasAgg.
+
+from math import ceil
+import numpy as np
+from matplotlib.figure import Figure
+
+
+MAX_BARRAS = 200
+MAX_ETIQUETAS = 30
+
+
+# ====================================================================================================
+# AGRUPAR PROBABILIDADES
+# ====================================================================================================
+# agrupar_probabilidades: Si hay más de max_barras valores, suma Pn en grupos consecutivos de igual tamaño, de modo que
+# cada barra es P(n en el grupo). Regresa las posiciones iniciales, las alturas y el ancho de cada grupo.
+def agrupar_probabilidades(Pn, max_barras=MAX_BARRAS):
+    Pn = np.asarray(Pn, dtype=float)
+    ancho = max(1, ceil(len(Pn) / max_barras))
+    inicios = np.arange(0, len(Pn), ancho)
+    if ancho == 1:
+        return inicios, Pn, ancho
+    return inicios, np.add.reduceat(Pn, inicios), ancho
+
+# ====================================================================================================
+# GRAFICA INCREMENTAL
+# ====================================================================================================
+# Las barras se dibujan con un solo artista (StepPatch) en lugar de un Rectangle por barra, así que actualizarlas es cambiar
+# un arreglo de alturas sin importar cuántas haya.
+class GraficaPn:
+    def __init__(self):
+        self.figura = Figure(figsize=(6, 3), facecolor='white')
+        self.ax = self.figura.add_subplot(111)
+        self.canvas = None
+
+        self._etiquetas = []
+        self._forma = None
+        self._fondo = None
+
+        self.ax.set_xlabel('n (número de clientes)', fontsize=12, color='black', labelpad=10)
+        self.ax.set_ylabel('Pₙ (probabilidad)', fontsize=12, color='black', labelpad=10)
+        self.ax.set_title('Distribución de Probabilidades Pₙ', fontsize=14, color='black', pad=15)
+        self.ax.set_facecolor('white')
+        self.ax.grid(True, axis='y', linestyle='--', alpha=0.4)
+
+        for spine in self.ax.spines.values():
+            spine.set_visible(False)
+
+        self.ax.tick_params(colors='black', labelsize=10)
+        self.figura.tight_layout()
+
+        self._barras = self.ax.stairs([0.0], [-0.5, 0.5], fill=True, facecolor='#4A90E2', edgecolor='black',
+                                      linewidth=0.5, animated=True, visible=False)
+
+    # conectar: Asocia el canvas y guarda el fondo cada vez que se hace un dibujo completo (por ejemplo al cambiar de tamaño).
+    def conectar(self, canvas):
+        self.canvas = canvas
+        canvas.mpl_connect("draw_event", self._al_dibujar)
+
+    # actualizar: Muestra Pn. Si el número de barras, su ancho y la escala no cambian, solo se actualizan las alturas y se
+    # copian con blitting; si no, se ajustan los ejes y se hace un dibujo completo. Regresa True en el segundo caso.
+    def actualizar(self, Pn):
+        inicios, alturas, ancho = agrupar_probabilidades(Pn)
+        if len(alturas) == 0:
+            self.limpiar()
+            return True
+
+        tope = self.ax.get_ylim()[1]
+        maximo = float(alturas.max())
+        forma = (len(Pn), ancho)
+
+        self._barras.set_visible(True)
+        if forma == self._forma and self._fondo is not None and tope / 3 < maximo * 1.15 <= tope:
+            self._barras.set_data(alturas)
+            for etiqueta, altura in zip(self._etiquetas, alturas):
+                etiqueta.set_y(altura + tope * 0.01)
+                etiqueta.set_text(f"{altura:.2f}")
+            self._blit()
+            return False
+
+        tope = maximo * 1.25 if maximo > 0 else 1.0
+        self._barras.set_data(alturas, np.append(inicios, len(Pn)) - 0.5)
+        self.ax.set_xlim(-0.5, len(Pn) - 0.5)
+        self.ax.set_ylim(0, tope)
+        self.ax.set_xlabel('n (número de clientes)' if ancho == 1 else f'n (número de clientes, grupos de {ancho})',
+                           fontsize=12, color='black', labelpad=10)
+        self._crear_etiquetas(inicios, alturas, tope)
+        self._forma = forma
+        self.canvas.draw_idle()
+        return True
+
+    # limpiar: Oculta las barras de la gráfica.
+    def limpiar(self):
+        self._barras.set_visible(False)
+        self._crear_etiquetas([], [], 1.0)
+        self._forma = None
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+
+    # _crear_etiquetas: Una etiqueta por barra solo si hay pocas barras; con más serían ilegibles.
+    def _crear_etiquetas(self, inicios, alturas, tope):
+        for etiqueta in self._etiquetas:
+            etiqueta.remove()
+        self._etiquetas = []
+
+        if len(alturas) <= MAX_ETIQUETAS:
+            self._etiquetas = [
+                self.ax.text(n, altura + tope * 0.01, f"{altura:.2f}", ha='center', va='bottom',
+                             fontsize=9, color='black', animated=True)
+                for n, altura in zip(inicios, alturas)
+            ]
+
+    # _al_dibujar: Después de un dibujo completo guarda el fondo (sin barras) y pinta las barras encima.
+    def _al_dibujar(self, evento):
+        self._fondo = self.canvas.copy_from_bbox(self.figura.bbox)
+        self._dibujar_animados()
+
+    def _blit(self):
+        self.canvas.restore_region(self._fondo)
+        self._dibujar_animados()
+        self.canvas.blit(self.figura.bbox)
+
+    def _dibujar_animados(self):
+        self.figura.draw_artist(self._barras)
+        for etiqueta in self._etiquetas:
+            self.figura.draw_artist(etiqueta)
@@ -0,0 +1,197 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# INSTRUMENTACION [CALCULO - FORMATO - GRAFICA]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Medir tramos con nombre (cálculo, formato, gráfica) con time.perf_counter.
+#   - Llevar contadores y valores (longitud de Pn, aciertos de la caché, ...).
+#   - Opcionalmente perfilar cada tramo con cProfile y medir la memoria con tracemalloc.
+#   - Exportar todo a JSON o mostrarlo en el panel de diagnóstico (diagnostico.py).
+#
+# Apagada (el valor por defecto) cada tramo cuesta una comparación y regresa un
+# contexto vacío compartido. Se enciende desde el panel o con la variable de entorno
+#   SIMULADOR_INSTRUMENTACION=1            (solo tiempos y contadores)
+#   SIMULADOR_INSTRUMENTACION=perfil,memoria
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from threading import Lock
+
+
+_SIN_MEDICION = nullcontext()
+
+
+# ====================================================================================================
+# INSTRUMENTACION
+# ====================================================================================================
+class Instrumentacion:
+    def __init__(self, activa=False, perfilar=False, memoria=False):
+        self.activa = False
+        self.perfilar = False
+        self.memoria = False
+        self._candado = Lock()
+        self._fuentes = {}
+        self.limpiar()
+        self.configurar(activa, perfilar, memoria)
+
+    # configurar: Enciende o apaga la instrumentación y los modos de captura. perfilar y memoria implican activa.
+    def configurar(self, activa=None, perfilar=None, memoria=None):
+        if perfilar is not None:
+            self.perfilar = perfilar
+        if memoria is not None:
+            if memoria and not tracemalloc.is_tracing():
+                tracemalloc.start()
+            elif not memoria and self.memoria and tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self.memoria = memoria
+        if activa is not None:
+            self.activa = activa
+        self.activa = self.activa or self.perfilar or self.memoria
+
+    # tramo: Contexto que mide el bloque con el nombre dado. Si la instrumentación está apagada no mide nada.
+    def tramo(self, nombre):
+        if not self.activa:
+            return _SIN_MEDICION
+        return self._medir(nombre)
+
+    @contextmanager
+    def _medir(self, nombre):
+        perfil = None
+        if self.perfilar:
+            perfil = cProfile.Profile()
+            try:
+                perfil.enable()
+            except ValueError:
+                # Ya hay otro perfilador activo (otro hilo midiendo al mismo tiempo): solo se toma el tiempo.
+                perfil = None
+        memoria = self.memoria and tracemalloc.is_tracing()
+        if memoria:
+            antes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter() - inicio
+            if perfil is not None:
+                perfil.disable()
+            pico = tracemalloc.get_traced_memory()[1] - antes if memoria else None
+            self._registrar_tramo(nombre, duracion, perfil, pico)
+
+    def _registrar_tramo(self, nombre, duracion, perfil, pico):
+        with self._candado:
+            datos = self._tramos.setdefault(nombre, {"llamadas": 0, "total_s": 0.0, "max_s": 0.0, "ultimo_s": 0.0})
+            datos["llamadas"] += 1
+            datos["total_s"] += duracion
+            datos["max_s"] = max(datos["max_s"], duracion)
+            datos["ultimo_s"] = duracion
+            if pico is not None:
+                datos["pico_memoria_bytes"] = max(datos.get("pico_memoria_bytes", 0), pico)
+            if perfil is not None:
+                if self._perfil is None:
+                    self._perfil = pstats.Stats(perfil)
+                else:
+                    self._perfil.add(perfil)
+
+    # contar: Suma valor al contador con el nombre dado.
+    def contar(self, nombre, valor=1):
+        if not self.activa:
+            return
+        with self._candado:
+            self._contadores[nombre] = self._contadores.get(nombre, 0) + valor
+
+    # registrar: Guarda un valor observado (por ejemplo la longitud de Pn) con su último valor y su máximo.
+    def registrar(self, nombre, valor):
+        if not self.activa:
+            return
+        with self._candado:
+            datos = self._valores.setdefault(nombre, {"ultimo": valor, "max": valor})
+            datos["ultimo"] = valor
+            datos["max"] = max(datos["max"], valor)
+
+    # agregar_fuente: Registra una función sin argumentos cuyo diccionario se incluye en el resumen (por ejemplo
+    # cache_metricas.info). Se consulta solo al pedir el resumen, así que no cuesta nada mientras se calcula.
+    def agregar_fuente(self, nombre, funcion):
+        self._fuentes[nombre] = funcion
+
+    # resumen: Regresa un diccionario serializable con los tramos, contadores, valores, fuentes y, si hay, el perfil.
+    def resumen(self, lineas_perfil=25):
+        with self._candado:
+            datos = {
+                "fecha": datetime.now().isoformat(timespec="seconds"),
+                "activa": self.activa,
+                "tramos": {nombre: dict(valores) for nombre, valores in self._tramos.items()},
+                "contadores": dict(self._contadores),
+                "valores": {nombre: dict(valores) for nombre, valores in self._valores.items()}
+            }
+            if self._perfil is not None:
+                texto = io.StringIO()
+                self._perfil.stream = texto
+                self._perfil.sort_stats("cumulative").print_stats(lineas_perfil)
+                datos["perfil"] = texto.getvalue()
+
+        for valores in datos["tramos"].values():
+            valores["promedio_s"] = valores["total_s"] / valores["llamadas"]
+        for nombre, funcion in self._fuentes.items():
+            datos[nombre] = funcion()
+
+        if self.memoria and tracemalloc.is_tracing():
+            estadisticas = tracemalloc.take_snapshot().statistics("lineno")[:10]
+            datos["memoria"] = [str(estadistica) for estadistica in estadisticas]
+
+        return datos
+
+    # exportar: Escribe el resumen en un archivo JSON.
+    def exportar(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(self.resumen(), archivo, ensure_ascii=False, indent=2)
+
+    # limpiar: Borra las mediciones acumuladas (no cambia la configuración).
+    def limpiar(self):
+        with self._candado:
+            self._tramos = {}
+            self._contadores = {}
+            self._valores = {}
+            self._perfil = None
+
+
+# _desde_entorno: Lee SIMULADOR_INSTRUMENTACION ("1", "perfil", "memoria" separados por comas).
+def _desde_entorno():
+    opciones = {opcion.strip().lower() for opcion in os.environ.get("SIMULADOR_INSTRUMENTACION", "").split(",")}
+    opciones.discard("")
+    opciones.discard("0")
+    return Instrumentacion(bool(opciones), "perfil" in opciones, "memoria" in opciones)
+
+
+# ====================================================================================================
+# INSTRUMENTACION COMPARTIDA
+# ====================================================================================================
+instrumentacion = _desde_entorno()
@@ -25,12 +25,19 @@
 
 import os
 import sys
+import queue
+import threading
 from PIL import Image
 import customtkinter as ctk
 from customtkinter import CTkImage
-from matplotlib.figure import Figure
 import tkinter.messagebox as messagebox
-from utils import mm1_metrics, mmc_metrics
+from barrido import PanelBarrido
+from cache import cache_metricas, mm1_metrics_cache, mmc_metrics_cache
+from diagnostico import PanelDiagnostico
+from instrumentacion import instrumentacion
+from resultados import ResultadoColas
+from grafica import GraficaPn
+from tabla_pn import TablaPn, preparar_tabla
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 
@@ -40,6 +47,12 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
+# --- Cálculo en segundo plano -----
+INTERVALO_SONDEO_MS = 50
+
+# --- Instrumentación (ver instrumentacion.py) -----
+instrumentacion.agregar_fuente("cache", cache_metricas.info)
+
 # ====================================================================================================
 # CONFIGURAR RUTAS PARA IMAGENES
 # ====================================================================================================
@@ -71,6 +84,14 @@ class SimuladorColas(ctk.CTk):
         self.modelo_var = ctk.StringVar(value="")
         self.modelo_var.trace_add("write", self.actualizar_campos)
         self.unidad_tiempo_var = ctk.StringVar(value="")
+
+        # --- Estado del Cálculo en Segundo Plano ------
+        self._cola_resultados = queue.Queue()
+        self._calculo_id = 0
+        self._cancelar = None
+        self._sondeando = False
+        self.panel_diagnostico = None
+        self.panel_barrido = None
         
         # --- Contenedor Principal -------
         self.grid_columnconfigure(0, weight=1)
@@ -145,7 +166,51 @@ class SimuladorColas(ctk.CTk):
             hover_color="#144e75",
             corner_radius=8
         )
-        self.boton_calcular.pack(pady=20)
+        self.boton_calcular.pack(pady=(20, 5))
+
+        self.barra_progreso = ctk.CTkProgressBar(self.panel_izquierdo, width=250)
+        self.barra_progreso.set(0)
+        self.barra_progreso.pack(pady=5)
+
+        self.boton_cancelar = ctk.CTkButton(
+            self.panel_izquierdo,
+            text="Cancelar",
+            command=self.cancelar_calculo,
+            font=ctk.CTkFont(size=14),
+            height=30,
+            width=250,
+            fg_color="#8a2c2c",
+            hover_color="#5e1e1e",
+            corner_radius=8,
+            state="disabled"
+        )
+        self.boton_cancelar.pack(pady=(5, 5))
+
+        self.boton_barrido = ctk.CTkButton(
+            self.panel_izquierdo,
+            text="Barrido (¿qué pasa si?)",
+            command=self.abrir_barrido,
+            font=ctk.CTkFont(size=14),
+            height=30,
+            width=250,
+            fg_color="#2c6e49",
+            hover_color="#1e4d33",
+            corner_radius=8
+        )
+        self.boton_barrido.pack(pady=5)
+
+        self.boton_diagnostico = ctk.CTkButton(
+            self.panel_izquierdo,
+            text="Diagnóstico",
+            command=self.abrir_diagnostico,
+            font=ctk.CTkFont(size=12),
+            height=24,
+            width=120,
+            fg_color="transparent",
+            border_width=1,
+            corner_radius=8
+        )
+        self.boton_diagnostico.pack(pady=(5, 20))
 
     # _crear_entrada: Crea un campo de entrada con su etiqueta (Label + Entry) y lo posiciona en el grid.
     def _crear_entrada(self, parent, label_text, row):
@@ -191,13 +256,13 @@ class SimuladorColas(ctk.CTk):
 
         ctk.CTkLabel(frame_prob, text="Probabilidades n-ésimas (Pₙ)", font=ctk.CTkFont(size=18, weight="bold"), anchor="w").pack(padx=10, pady=5, fill="x")
 
-        self.prob_text = ctk.CTkTextbox(frame_prob, height=150, font=ctk.CTkFont(size=14))
-        self.prob_text.pack(padx=10, pady=5, fill="x")
-        self.prob_text.configure(state="disabled")
+        self.tabla_pn = TablaPn(frame_prob)
+        self.tabla_pn.pack(fill="x")
         ctk.CTkFrame(frame_prob, height=10, fg_color="transparent").pack()
 
         self.frame_grafica = ctk.CTkFrame(self.scrollable_frame_resultados, corner_radius=10)
         self.frame_grafica.pack(padx=10, pady=10, fill="both", expand=True)
+        self.grafica = None
 
     # _crear_label_resultado: Crea una fila para mostrar el nombre y valor de cada métrica.
     def _crear_label_resultado(self, parent, texto):
@@ -212,62 +277,132 @@ class SimuladorColas(ctk.CTk):
 
         return {"label": label, "valor": valor}
 
-    # calcular: Obtiene los datos ingresados, calcula las métricas del modelo seleccionado (MM1 o MMc), y muestra los resultados y la gráfica.
+    # calcular: Obtiene los datos ingresados y lanza el cálculo de las métricas del modelo seleccionado (MM1 o MMc) en un hilo
+    # de trabajo. Si había un cálculo en curso se cancela y su resultado se descarta al llegar.
     def calcular(self):
-        self.boton_calcular.configure(state="disabled", text="Calculando...")
-
         try:
             if self.modelo_var.get() == "" or self.unidad_tiempo_var.get() == "":
                 self.mostrar_error("Por favor selecciona un modelo y una unidad de tiempo.")
                 return
-            
+
+            modelo = self.modelo_var.get()
             lambd = float(self.lambda_entry.get())
             mu = float(self.mu_entry.get())
             n_max = int(self.n_entry.get())
-            
-            if self.modelo_var.get() == "MMc":
-                s = int(self.s_entry.get())
-                resultado = mmc_metrics(lambd, mu, s, n_max)
-            else:
-                resultado = mm1_metrics(lambd, mu, n_max)
+            s = int(self.s_entry.get()) if modelo == "MMc" else None
+
+        except ValueError:
+            self.mostrar_error("Error: Por favor, ingrese valores numéricos válidos.")
+            return
+
+        if self._cancelar is not None:
+            self._cancelar.set()
+
+        self._calculo_id += 1
+        self._cancelar = threading.Event()
+        hilo = threading.Thread(
+            target=self._trabajo_calculo,
+            args=(self._calculo_id, self._cancelar, modelo, lambd, mu, s, n_max),
+            daemon=True
+        )
+        hilo.start()
+
+        self.boton_calcular.configure(text="Calculando...")
+        self.boton_cancelar.configure(state="normal")
+        self.barra_progreso.set(0)
+
+        if not self._sondeando:
+            self._sondeando = True
+            self.after(INTERVALO_SONDEO_MS, self._revisar_resultados)
+
+    # cancelar_calculo: Cancela el cálculo en curso; lo que el hilo de trabajo envíe después se ignora.
+    def cancelar_calculo(self):
+        if self._cancelar is not None:
+            self._cancelar.set()
+            self._cancelar = None
+        self._calculo_id += 1
+        self._terminar_calculo()
+
+    # _trabajo_calculo: Corre en el hilo de trabajo. Calcula las métricas y prepara la tabla de probabilidades, reportando
+    # el avance por la cola. Nunca toca los widgets: la ventana recoge los mensajes con _revisar_resultados.
+    def _trabajo_calculo(self, calculo_id, cancelar, modelo, lambd, mu, s, n_max):
+        cola = self._cola_resultados
+        try:
+            with instrumentacion.tramo("calculo"):
+                if modelo == "MMc":
+                    resultado = mmc_metrics_cache(lambd, mu, s, n_max)
+                else:
+                    resultado = mm1_metrics_cache(lambd, mu, n_max)
+            instrumentacion.contar("calculos")
 
             if isinstance(resultado, str):
-                self.mostrar_error(resultado)
+                instrumentacion.contar("errores")
+                cola.put(("error", calculo_id, resultado))
                 return
 
-            self.mostrar_resultados(resultado)
-            self.mostrar_grafica(resultado["Pn"])
+            resultado = ResultadoColas.desde_dict(resultado, modelo, lambd, mu, s or 1)
+            instrumentacion.registrar("Pn (longitud)", len(resultado.Pn))
+            cola.put(("progreso", calculo_id, 0.5))
+            if cancelar.is_set():
+                return
 
-            self.limpiar_campos_izq()
+            with instrumentacion.tramo("preparar_tabla"):
+                tabla = preparar_tabla(resultado.Pn)
+            cola.put(("progreso", calculo_id, 1.0))
+            if not cancelar.is_set():
+                cola.put(("resultado", calculo_id, (resultado, tabla)))
 
-        except ValueError:
-            self.mostrar_error("Error: Por favor, ingrese valores numéricos válidos.")
-        
-        finally:
-            self.boton_calcular.configure(state="normal", text="¿Listo para calcular?")
+        # Cualquier excepción (incluido MemoryError con n_max enorme) termina en un mensaje; si no, la ventana se
+        # quedaría en "Calculando..." porque el hilo muere sin avisar.
+        except Exception as error:
+            cola.put(("error", calculo_id, f"Error: {str(error) or type(error).__name__}"))
+
+    # _revisar_resultados: Sondea la cola con after() desde el hilo principal y descarta los mensajes de cálculos viejos.
+    def _revisar_resultados(self):
+        try:
+            while True:
+                tipo, calculo_id, contenido = self._cola_resultados.get_nowait()
+                if calculo_id != self._calculo_id:
+                    continue
+
+                if tipo == "progreso":
+                    self.barra_progreso.set(contenido)
+                elif tipo == "error":
+                    self._terminar_calculo()
+                    self.mostrar_error(contenido)
+                else:
+                    resultado, tabla = contenido
+                    self._terminar_calculo()
+                    with instrumentacion.tramo("formato"):
+                        self.mostrar_resultados(resultado, tabla)
+                    with instrumentacion.tramo("grafica"):
+                        self.mostrar_grafica(resultado.Pn)
+                        # El dibujo completo se agenda con draw_idle; al medir se fuerza aquí para que cuente en el tramo.
+                        if instrumentacion.activa:
+                            self.update_idletasks()
+                    self.limpiar_campos_izq()
+        except queue.Empty:
+            pass
+
+        if self._cancelar is not None:
+            self.after(INTERVALO_SONDEO_MS, self._revisar_resultados)
+        else:
+            self._sondeando = False
+
+    # _terminar_calculo: Regresa los botones y la barra de progreso a su estado de reposo.
+    def _terminar_calculo(self):
+        self._cancelar = None
+        self.boton_calcular.configure(state="normal", text="¿Listo para calcular?")
+        self.boton_cancelar.configure(state="disabled")
+        self.barra_progreso.set(0)
 
     # mostrar_resultados: Se encarga de mostrar los resultados calculados (métricas y probabilidades) después de presionar el botón "Calcular".
-    def mostrar_resultados(self, resultado):
-        metricas = {
-            "rho": resultado["rho (factor de uso)"],
-            "Ls": resultado["Ls (clientes esperados en el sistema)"],
-            "Lq": resultado["Lq (clientes esperados en la cola)"],
-            "Ws": resultado["Ws (tiempo esperado en el sistema)"],
-            "Wq": resultado["Wq (tiempo esperado en la cola)"],
-            "P0": resultado["P0 (probabilidad del sistema vacío)"]
-        }
-        
-        for key, value in metricas.items():
-            self.labels_resultados[key]["valor"].configure(text=f"{value:.4f}")
-
-        self.prob_text.configure(state="normal")
-        self.prob_text.delete("1.0", "end")
-        prob_texto = ""
-        for i, p in enumerate(resultado["Pn"]):
-            porcentaje = p * 100
-            prob_texto += f"P{i} = {porcentaje:.2f}%\n"
-        self.prob_text.insert("1.0", prob_texto)
-        self.prob_text.configure(state="disabled")
+    # resultado es un ResultadoColas, así que cada etiqueta se llena con el atributo del mismo nombre.
+    def mostrar_resultados(self, resultado, tabla):
+        for key, item in self.labels_resultados.items():
+            item["valor"].configure(text=f"{getattr(resultado, key):.4f}")
+
+        self.tabla_pn.mostrar(*tabla)
 
     # limpiar_campos: Limpia los campos del panel izquierdo.
     def limpiar_campos_izq(self):
@@ -284,12 +419,10 @@ class SimuladorColas(ctk.CTk):
         for item in self.labels_resultados.values():
             item["valor"].configure(text="---")
 
-        self.prob_text.configure(state="normal")
-        self.prob_text.delete("1.0", "end")
-        self.prob_text.configure(state="disabled")
+        self.tabla_pn.limpiar()
 
-        for widget in self.frame_grafica.winfo_children():
-            widget.destroy()
+        if self.grafica is not None:
+            self.grafica.limpiar()
 
     # mostrar_error: Crear una ventana popup para mostrar posibles errores.
     def mostrar_error(self, mensaje):
@@ -297,38 +430,40 @@ class SimuladorColas(ctk.CTk):
         self.limpiar_campos_izq()
         self.limpiar_campos_der()
 
-    # mostrar_grafica: Grafica las probabilidades n-ésimas.
-    def mostrar_grafica(self, Pn):
-        for widget in self.frame_grafica.winfo_children():
-            widget.destroy()
-
-        fig = Figure(figsize=(6, 3), facecolor='white')
-        ax = fig.add_subplot(111)
-
-        barras = ax.bar(range(len(Pn)), Pn, color='#4A90E2', edgecolor='black', linewidth=0.5)
-
-        ax.set_xlabel('n (número de clientes)', fontsize=12, color='black', labelpad=10)
-        ax.set_ylabel('Pₙ (probabilidad)', fontsize=12, color='black', labelpad=10)
-        ax.set_title('Distribución de Probabilidades Pₙ', fontsize=14, color='black', pad=15)
-
-        fig.tight_layout()
-
-        ax.set_facecolor('white')
-        ax.grid(True, axis='y', linestyle='--', alpha=0.4)
-
-        for spine in ax.spines.values():
-            spine.set_visible(False)
-
-        ax.tick_params(colors='black', labelsize=10)
+    # abrir_barrido: Abre el panel de barrido centrado en los datos escritos (los que sean válidos) sin borrarlos.
+    def abrir_barrido(self):
+        valores = {}
+        for nombre, entry, tipo in (("lambd", self.lambda_entry, float), ("mu", self.mu_entry, float), ("s", self.s_entry, int)):
+            try:
+                valores[nombre] = tipo(entry.get())
+            except ValueError:
+                valores[nombre] = None
+        if self.modelo_var.get() == "MM1":
+            valores["s"] = 1
+
+        if self.panel_barrido is not None and self.panel_barrido.winfo_exists():
+            self.panel_barrido.destroy()
+        self.panel_barrido = PanelBarrido(self, **valores)
+        self.panel_barrido.focus()
+
+    # abrir_diagnostico: Abre el panel de diagnóstico (una sola ventana; si ya existe solo se le da el foco).
+    def abrir_diagnostico(self):
+        if self.panel_diagnostico is None or not self.panel_diagnostico.winfo_exists():
+            self.panel_diagnostico = PanelDiagnostico(self)
+        else:
+            self.panel_diagnostico.actualizar()
+        self.panel_diagnostico.focus()
 
-        for i, bar in enumerate(barras):
-            altura = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2, altura + 0.005, f"{altura:.2f}",
-                    ha='center', va='bottom', fontsize=9, color='black')
+    # mostrar_grafica: Grafica las probabilidades n-ésimas. La figura y el canvas se crean una sola vez; después solo se
+    # actualizan las barras (ver grafica.py).
+    def mostrar_grafica(self, Pn):
+        if self.grafica is None:
+            self.grafica = GraficaPn()
+            canvas = FigureCanvasTkAgg(self.grafica.figura, master=self.frame_grafica)
+            self.grafica.conectar(canvas)
+            canvas.get_tk_widget().pack(fill="both", expand=True)
 
-        canvas = FigureCanvasTkAgg(fig, master=self.frame_grafica)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.grafica.actualizar(Pn)
 
 
 # ====================================================================================================
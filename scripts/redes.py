@@ -0,0 +1,271 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# REDES DE COLAS [ESTACIONES MMc CON ENRUTAMIENTO]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Resolver redes de Jackson (capacidad infinita) en forma producto con mmc_metrics.
+#   - Construir el generador de la cadena de Markov (CTMC) de una red con capacidades
+#     finitas en arreglos CSR, sin matrices densas.
+#   - Obtener la distribución estacionaria con el método de potencia (uniformización)
+#     o con Gauss-Seidel, y las métricas de cada estación.
+#
+# Parámetros comunes (m estaciones):
+#   - llegadas_externas: tasas λ0 de llegada desde fuera a cada estación.
+#   - mu, servidores: tasa de servicio y número de servidores de cada estación.
+#   - enrutamiento: matriz m×m con P[i][j] = probabilidad de ir de i a j al terminar;
+#     1 - Σ_j P[i][j] es la probabilidad de salir de la red.
+#   - capacidades: número máximo de clientes en cada estación (para la CTMC). Un
+#     cliente enrutado a una estación llena se pierde.
+
+import numpy as np
+from utils import mmc_metrics, nacimiento_muerte
+
+
+# ====================================================================================================
+# RED DE JACKSON (FORMA PRODUCTO)
+# ====================================================================================================
+# jackson_metrics: Resuelve las ecuaciones de tráfico λ = λ0 + Pᵀλ y evalúa cada estación como una MMc independiente.
+def jackson_metrics(llegadas_externas, mu, servidores, enrutamiento, n_max=0):
+    llegadas_externas, mu, servidores, P = _normalizar_red(llegadas_externas, mu, servidores, enrutamiento)
+
+    try:
+        lambdas = np.linalg.solve(np.eye(len(mu)) - P.T, llegadas_externas)
+    except np.linalg.LinAlgError:
+        return "\nERROR: La matriz de enrutamiento no deja salir a los clientes de la red."
+
+    estaciones = []
+    for i, (lambd, m, s) in enumerate(zip(lambdas, mu, servidores)):
+        resultado = mmc_metrics(float(lambd), float(m), int(s), n_max)
+        if isinstance(resultado, str):
+            return f"{resultado} (estación {i})"
+        estaciones.append(resultado)
+
+    Ls_red = sum(e["Ls (clientes esperados en el sistema)"] for e in estaciones)
+    lambda_red = float(llegadas_externas.sum())
+    return {
+        "estaciones": estaciones,
+        "lambda (tasas de llegada por estación)": lambdas.tolist(),
+        "Ls (clientes esperados en la red)": Ls_red,
+        "Ws (tiempo esperado en la red)": Ls_red / lambda_red if lambda_red > 0 else 0.0
+    }
+
+# ====================================================================================================
+# GENERADOR DE LA CTMC EN CSR
+# ====================================================================================================
+# GeneradorCSR: Generador Q guardado por columnas (CSR de Qᵀ): para cada estado destino j, los estados origen
+# indices[indptr[j]:indptr[j+1]] y sus tasas data[...]. salidas[i] es la tasa total de salida de i (-q_ii).
+# Con esta forma, x·Q se calcula fila por fila y Gauss-Seidel recorre los destinos en orden.
+class GeneradorCSR:
+    __slots__ = ("indptr", "indices", "data", "salidas", "capacidades", "pasos")
+
+    def __init__(self, indptr, indices, data, salidas, capacidades, pasos):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.salidas = salidas
+        self.capacidades = capacidades
+        self.pasos = pasos
+
+    @property
+    def n_estados(self):
+        return len(self.salidas)
+
+    # entradas: Σ_i x_i·q_ij para cada j (la parte fuera de la diagonal de x·Q).
+    def entradas(self, x):
+        productos = self.data * x[self.indices]
+        y = np.zeros(self.n_estados)
+        no_vacias = self.indptr[:-1] < self.indptr[1:]
+        if productos.size:
+            y[no_vacias] = np.add.reduceat(productos, self.indptr[:-1][no_vacias])
+        return y
+
+    # niveles: Número de clientes de la estación i en cada estado (codificación de base mixta).
+    def niveles(self, i):
+        return (np.arange(self.n_estados, dtype=np.int64) // self.pasos[i]) % (self.capacidades[i] + 1)
+
+# generador_red: Construye la CTMC de la red con todas las transiciones calculadas de forma vectorizada por estación.
+# Índices en int32 y tasas en float64: con pocas estaciones, millones de estados caben en unos cientos de MB.
+def generador_red(llegadas_externas, mu, servidores, enrutamiento, capacidades):
+    llegadas_externas, mu, servidores, P = _normalizar_red(llegadas_externas, mu, servidores, enrutamiento)
+    capacidades = np.asarray(capacidades, dtype=np.int64)
+    m = len(mu)
+    pasos = np.concatenate(([1], np.cumprod(capacidades + 1)[:-1]))
+    n_estados = int(np.prod(capacidades + 1))
+    if n_estados >= 2**31:
+        raise ValueError("El espacio de estados es demasiado grande para índices de 32 bits.")
+
+    estados = np.arange(n_estados, dtype=np.int32)
+    niveles = [(estados // pasos[i]) % (capacidades[i] + 1) for i in range(m)]
+    origenes, destinos, tasas = [], [], []
+
+    def agregar(mascara, desplazamiento, tasa):
+        if np.isscalar(tasa):
+            if tasa <= 0:
+                return
+            tasa = np.full(int(mascara.sum()), tasa, dtype=float)
+        else:
+            tasa = tasa[mascara]
+        origen = estados[mascara]
+        origenes.append(origen)
+        destinos.append((origen + desplazamiento).astype(np.int32))
+        tasas.append(tasa)
+
+    for i in range(m):
+        # Llegadas externas a i.
+        agregar(niveles[i] < capacidades[i], pasos[i], float(llegadas_externas[i]))
+
+        # Terminaciones de servicio en i, repartidas según el enrutamiento.
+        ocupada = niveles[i] > 0
+        tasa_servicio = mu[i] * np.minimum(niveles[i], servidores[i]).astype(float)
+        salida = 1.0 - P[i].sum()
+        perdida = np.zeros(n_estados)
+        for j in range(m):
+            if P[i, j] <= 0 or j == i:
+                continue
+            libre = ocupada & (niveles[j] < capacidades[j])
+            agregar(libre, pasos[j] - pasos[i], tasa_servicio * P[i, j])
+            perdida += np.where(ocupada & ~libre, P[i, j], 0.0)
+        agregar(ocupada, -pasos[i], tasa_servicio * (salida + perdida))
+
+    origen = np.concatenate(origenes) if origenes else np.zeros(0, dtype=np.int32)
+    destino = np.concatenate(destinos) if destinos else np.zeros(0, dtype=np.int32)
+    tasa = np.concatenate(tasas) if tasas else np.zeros(0)
+
+    positivas = tasa > 0
+    origen, destino, tasa = origen[positivas], destino[positivas], tasa[positivas]
+    orden = np.argsort(destino, kind="stable")
+    indptr = np.searchsorted(destino[orden], np.arange(n_estados + 1)).astype(np.int64)
+    salidas = np.bincount(origen, weights=tasa, minlength=n_estados)
+
+    return GeneradorCSR(indptr, origen[orden], tasa[orden], salidas, capacidades, pasos)
+
+# ====================================================================================================
+# DISTRIBUCION ESTACIONARIA
+# ====================================================================================================
+# estacionaria: Resuelve π·Q = 0 con Σπ = 1.
+#   - "potencia": iteración x ← x + x·Q/Λ (uniformización); todo vectorizado, apto para millones de estados.
+#   - "gauss-seidel": x_j = Σ_i x_i·q_ij / (-q_jj) usando los valores ya actualizados; converge en menos barridos
+#     pero recorre los estados en Python, así que conviene para espacios de estados moderados.
+def estacionaria(generador, metodo="potencia", x0=None, tol=1e-10, max_iter=100_000):
+    x = np.full(generador.n_estados, 1.0 / generador.n_estados) if x0 is None else np.array(x0, dtype=float)
+    x /= x.sum()
+
+    if metodo == "potencia":
+        uniformizacion = generador.salidas.max() * 1.05
+        for iteracion in range(1, max_iter + 1):
+            nuevo = x + (generador.entradas(x) - x * generador.salidas) / uniformizacion
+            nuevo /= nuevo.sum()
+            residuo = float(np.abs(nuevo - x).sum())
+            x = nuevo
+            if residuo < tol:
+                break
+    elif metodo == "gauss-seidel":
+        indptr = generador.indptr
+        indices = generador.indices
+        data = generador.data
+        salidas = generador.salidas
+        for iteracion in range(1, max_iter + 1):
+            anterior = x.copy()
+            for j in range(generador.n_estados):
+                if salidas[j] > 0:
+                    inicio, fin = indptr[j], indptr[j + 1]
+                    x[j] = np.dot(data[inicio:fin], x[indices[inicio:fin]]) / salidas[j]
+            x /= x.sum()
+            residuo = float(np.abs(x - anterior).sum())
+            if residuo < tol:
+                break
+    else:
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    return x, iteracion, residuo
+
+# ====================================================================================================
+# METRICAS DE LA RED
+# ====================================================================================================
+# red_metrics: Métricas por estación de una red con capacidades finitas a partir de la CTMC. Si todas las capacidades son
+# None usa el camino rápido en forma producto (jackson_metrics). El punto de partida es el producto de las marginales
+# MMcK con las tasas de las ecuaciones de tráfico, que suele estar muy cerca de la solución.
+def red_metrics(llegadas_externas, mu, servidores, enrutamiento, capacidades=None, n_max=0, metodo="potencia", tol=1e-10, max_iter=100_000):
+    if capacidades is None:
+        return jackson_metrics(llegadas_externas, mu, servidores, enrutamiento, n_max)
+
+    llegadas_externas, mu, servidores, P = _normalizar_red(llegadas_externas, mu, servidores, enrutamiento)
+    generador = generador_red(llegadas_externas, mu, servidores, P, capacidades)
+
+    try:
+        lambdas = np.linalg.solve(np.eye(len(mu)) - P.T, llegadas_externas)
+    except np.linalg.LinAlgError:
+        lambdas = llegadas_externas
+    marginales = [
+        nacimiento_muerte(np.full(k, max(float(l), 1e-12)), m * np.minimum(np.arange(1, k + 1), s))
+        for l, m, s, k in zip(lambdas, mu, servidores, generador.capacidades)
+    ]
+    x0 = marginales[-1]
+    for marginal in reversed(marginales[:-1]):
+        x0 = np.multiply.outer(x0, marginal).ravel()
+
+    pi, iteraciones, residuo = estacionaria(generador, metodo, x0, tol, max_iter)
+
+    estaciones = []
+    for i in range(len(mu)):
+        k = int(generador.capacidades[i])
+        p = np.bincount(generador.niveles(i), weights=pi, minlength=k + 1)
+        n = np.arange(k + 1)
+        Ls = float(np.dot(n, p))
+        Lq = float(np.dot(np.maximum(n - servidores[i], 0), p))
+        c_bar = Ls - Lq
+        throughput = c_bar * float(mu[i])
+        Pn = np.zeros(max(n_max + 1, 0))
+        Pn[:min(k + 1, len(Pn))] = p[:len(Pn)]
+        estaciones.append({
+            "rho (factor de uso)": c_bar / int(servidores[i]),
+            "Ls (clientes esperados en el sistema)": Ls,
+            "Lq (clientes esperados en la cola)": Lq,
+            "Ws (tiempo esperado en el sistema)": Ls / throughput if throughput > 0 else 1 / float(mu[i]),
+            "Wq (tiempo esperado en la cola)": Lq / throughput if throughput > 0 else 0.0,
+            "c_bar (servidores ocupados)": c_bar,
+            "P0 (probabilidad del sistema vacío)": float(p[0]),
+            "Pn": Pn.tolist(),
+            "P_bloqueo (probabilidad de bloqueo)": float(p[k]),
+            "lambda_ef (tasa efectiva de llegada)": throughput
+        })
+
+    Ls_red = sum(e["Ls (clientes esperados en el sistema)"] for e in estaciones)
+    lambda_red = float(sum(l * (1 - e["P_bloqueo (probabilidad de bloqueo)"]) for l, e in zip(llegadas_externas, estaciones)))
+    return {
+        "estaciones": estaciones,
+        "lambda (tasas de llegada por estación)": [e["lambda_ef (tasa efectiva de llegada)"] for e in estaciones],
+        "Ls (clientes esperados en la red)": Ls_red,
+        "Ws (tiempo esperado en la red)": Ls_red / lambda_red if lambda_red > 0 else 0.0,
+        "estados": generador.n_estados,
+        "iteraciones": iteraciones,
+        "residuo": residuo
+    }
+
+# _normalizar_red: Convierte los parámetros a arreglos de NumPy con las formas esperadas.
+def _normalizar_red(llegadas_externas, mu, servidores, enrutamiento):
+    llegadas_externas = np.asarray(llegadas_externas, dtype=float)
+    mu = np.asarray(mu, dtype=float)
+    servidores = np.asarray(servidores, dtype=np.int64)
+    P = np.asarray(enrutamiento, dtype=float).reshape(len(mu), len(mu))
+    return llegadas_externas, mu, servidores, P
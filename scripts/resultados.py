@@ -0,0 +1,276 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# RESULTADOS COMPACTOS Y ALMACENAMIENTO COLUMNAR [MODELO MM1 - MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Representar un resultado con ResultadoColas (__slots__ y Pn como arreglo de
+#     NumPy) en lugar de un diccionario con llaves largas y una lista de flotantes.
+#   - Convertir desde / hacia los diccionarios de mm1_metrics y mmc_metrics.
+#   - Guardar muchos resultados en un directorio de archivos .npy, uno por columna;
+#     Pn se guarda plano junto con sus desplazamientos (como una columna de listas).
+#   - Volver a cargarlos sin copiar, mapeando los archivos en memoria (mmap_mode="r").
+#
+# Los .npy se escriben por bloques y el encabezado se reescribe al cerrar con el
+# número final de filas, así que el escritor no guarda los resultados en memoria.
+
+import json
+import os
+import numpy as np
+from utils import mm1_metrics, mmc_metrics, pn_arreglo
+
+
+MODELOS = ("MM1", "MMc")
+
+# Atributo corto -> llave larga de los diccionarios de utils.py.
+CLAVES = {
+    "rho": "rho (factor de uso)",
+    "Ls": "Ls (clientes esperados en el sistema)",
+    "Lq": "Lq (clientes esperados en la cola)",
+    "Ws": "Ws (tiempo esperado en el sistema)",
+    "Wq": "Wq (tiempo esperado en la cola)",
+    "c_bar": "c_bar (servidores ocupados)",
+    "P0": "P0 (probabilidad del sistema vacío)"
+}
+
+# Columnas escalares del formato columnar y su tipo.
+COLUMNAS = {
+    "modelo": np.uint8,
+    "lambd": np.float64,
+    "mu": np.float64,
+    "s": np.int64,
+    "estable": np.bool_,
+    **{campo: np.float64 for campo in CLAVES}
+}
+
+# Todos los archivos del directorio: las columnas escalares más Pn plano y sus desplazamientos.
+ARCHIVOS = {**COLUMNAS, "Pn_valores": np.float64, "Pn_inicios": np.int64}
+
+_TAMANO_ENCABEZADO = 128
+
+
+# ====================================================================================================
+# RESULTADO COMPACTO
+# ====================================================================================================
+# Un resultado estable de MM1 o MMc. Para MM1, s = 1 y c_bar = ρ. Pn es un arreglo float64 (puede ser una vista de un
+# archivo mapeado en memoria).
+class ResultadoColas:
+    __slots__ = ("modelo", "lambd", "mu", "s", "rho", "Ls", "Lq", "Ws", "Wq", "c_bar", "P0", "Pn")
+
+    def __init__(self, modelo, lambd, mu, s, rho, Ls, Lq, Ws, Wq, c_bar, P0, Pn):
+        self.modelo = modelo
+        self.lambd = lambd
+        self.mu = mu
+        self.s = s
+        self.rho = rho
+        self.Ls = Ls
+        self.Lq = Lq
+        self.Ws = Ws
+        self.Wq = Wq
+        self.c_bar = c_bar
+        self.P0 = P0
+        self.Pn = Pn
+
+    # desde_dict: Construye el resultado a partir del diccionario de mm1_metrics / mmc_metrics. Si recibe el mensaje
+    # de error (un str) lanza ValueError con ese mensaje.
+    @classmethod
+    def desde_dict(cls, resultado, modelo, lambd, mu, s=1):
+        if isinstance(resultado, str):
+            raise ValueError(resultado.strip())
+        metricas = {campo: float(resultado[clave]) for campo, clave in CLAVES.items() if clave in resultado}
+        metricas.setdefault("c_bar", metricas["rho"] * s)
+        return cls(modelo, float(lambd), float(mu), int(s), Pn=np.asarray(resultado["Pn"], dtype=float), **metricas)
+
+    # a_dict: Regresa el diccionario con las mismas llaves que mm1_metrics / mmc_metrics (Pn como lista).
+    def a_dict(self):
+        resultado = {clave: getattr(self, campo) for campo, clave in CLAVES.items()}
+        if self.modelo == "MM1":
+            del resultado[CLAVES["c_bar"]]
+        resultado["Pn"] = self.Pn.tolist()
+        return resultado
+
+    # metricas: Diccionario corto {"rho": ..., "Ls": ..., ...} sin Pn.
+    def metricas(self):
+        return {campo: getattr(self, campo) for campo in CLAVES}
+
+    def __repr__(self):
+        parametros = f"λ={self.lambd}, μ={self.mu}" + (f", c={self.s}" if self.modelo == "MMc" else "")
+        return f"ResultadoColas({self.modelo}, {parametros}, Ls={self.Ls:.6g}, Wq={self.Wq:.6g}, len(Pn)={len(self.Pn)})"
+
+
+# mm1_resultado / mmc_resultado: Igual que mm1_metrics / mmc_metrics pero regresan ResultadoColas y construyen Pn
+# directamente como arreglo (sin pasar por una lista). Lanzan ValueError si el sistema es inestable.
+def mm1_resultado(lambd, mu, n_max):
+    resultado = ResultadoColas.desde_dict(mm1_metrics(lambd, mu, 0), "MM1", lambd, mu)
+    resultado.Pn = pn_arreglo(lambd, mu, 1, n_max)
+    return resultado
+
+def mmc_resultado(lambd, mu, s, n_max):
+    resultado = ResultadoColas.desde_dict(mmc_metrics(lambd, mu, s, 0), "MMc", lambd, mu, s)
+    resultado.Pn = pn_arreglo(lambd, mu, s, n_max)
+    return resultado
+
+# ====================================================================================================
+# ESCRITOR COLUMNAR
+# ====================================================================================================
+# Escribe un archivo .npy por columna en el directorio, más Pn_valores.npy (todas las Pn una tras otra) y
+# Pn_inicios.npy (n + 1 desplazamientos: Pn de la fila i es Pn_valores[Pn_inicios[i]:Pn_inicios[i + 1]]).
+# Los resultados individuales se juntan en un búfer; los lotes de mm1_metrics_batch / mmc_metrics_batch se escriben
+# directo.
+class EscritorColumnar:
+    def __init__(self, directorio, tamano_bufer=65_536):
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+        self.tamano_bufer = tamano_bufer
+        self.filas = 0
+        self._valores = 0
+        self._bufer = {nombre: [] for nombre in COLUMNAS}
+        self._bufer_Pn = []
+        self._archivos = {}
+
+        for nombre, tipo in ARCHIVOS.items():
+            archivo = open(os.path.join(directorio, f"{nombre}.npy"), "wb")
+            archivo.write(_encabezado_npy(np.dtype(tipo), 0))
+            self._archivos[nombre] = archivo
+        self._archivos["Pn_inicios"].write(np.zeros(1, dtype=np.int64).tobytes())
+
+    # agregar: Agrega un ResultadoColas.
+    def agregar(self, resultado):
+        fila = {"modelo": MODELOS.index(resultado.modelo), "lambd": resultado.lambd, "mu": resultado.mu,
+                "s": resultado.s, "estable": True, **resultado.metricas()}
+        for nombre, valor in fila.items():
+            self._bufer[nombre].append(valor)
+        self._bufer_Pn.append(np.asarray(resultado.Pn, dtype=np.float64))
+        if len(self._bufer_Pn) >= self.tamano_bufer:
+            self._vaciar()
+
+    # agregar_lote: Agrega el diccionario de mm1_metrics_batch (s=None) o mmc_metrics_batch con sus parámetros. Los puntos
+    # inestables se guardan con estable = False y métricas NaN.
+    def agregar_lote(self, lote, lambd, mu, s=None):
+        self._vaciar()
+        estable = np.asarray(lote["estable"])
+        forma = estable.shape
+        columnas = {
+            "modelo": np.full(forma, MODELOS.index("MM1" if s is None else "MMc")),
+            "lambd": np.broadcast_to(lambd, forma),
+            "mu": np.broadcast_to(mu, forma),
+            "s": np.broadcast_to(1 if s is None else s, forma),
+            "estable": estable
+        }
+        for campo, clave in CLAVES.items():
+            columnas[campo] = lote[clave] if clave in lote else lote[CLAVES["rho"]]
+
+        Pn = np.asarray(lote["Pn"], dtype=np.float64).reshape(-1, lote["Pn"].shape[-1])
+        self._escribir(columnas, Pn.ravel(), np.full(len(Pn), Pn.shape[1]))
+
+    # cerrar: Escribe lo pendiente y reescribe los encabezados con el número final de filas.
+    def cerrar(self):
+        if not self._archivos:
+            return
+        self._vaciar()
+        totales = {nombre: self.filas for nombre in COLUMNAS}
+        totales.update(Pn_valores=self._valores, Pn_inicios=self.filas + 1)
+        for nombre, archivo in self._archivos.items():
+            archivo.seek(0)
+            archivo.write(_encabezado_npy(np.dtype(ARCHIVOS[nombre]), totales[nombre]))
+            archivo.close()
+        self._archivos = {}
+
+        with open(os.path.join(self.directorio, "esquema.json"), "w", encoding="utf-8") as archivo:
+            json.dump({"filas": self.filas, "columnas": list(COLUMNAS), "modelos": MODELOS}, archivo, ensure_ascii=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def _vaciar(self):
+        if not self._bufer_Pn:
+            return
+        longitudes = np.array([len(Pn) for Pn in self._bufer_Pn])
+        self._escribir(self._bufer, np.concatenate(self._bufer_Pn), longitudes)
+        self._bufer = {nombre: [] for nombre in COLUMNAS}
+        self._bufer_Pn = []
+
+    def _escribir(self, columnas, valores_Pn, longitudes):
+        for nombre, tipo in COLUMNAS.items():
+            self._archivos[nombre].write(np.ravel(np.asarray(columnas[nombre], dtype=tipo)).tobytes())
+        self._archivos["Pn_valores"].write(valores_Pn.tobytes())
+        self._archivos["Pn_inicios"].write((self._valores + np.cumsum(longitudes, dtype=np.int64)).tobytes())
+        self.filas += len(longitudes)
+        self._valores += len(valores_Pn)
+
+
+# _encabezado_npy: Encabezado .npy versión 1.0 de tamaño fijo (_TAMANO_ENCABEZADO bytes), para poder reescribirlo al
+# cerrar sin mover los datos.
+def _encabezado_npy(tipo, filas):
+    descripcion = repr({"descr": np.lib.format.dtype_to_descr(tipo), "fortran_order": False, "shape": (filas,)})
+    relleno = _TAMANO_ENCABEZADO - len(np.lib.format.MAGIC_PREFIX) - 2 - 2 - len(descripcion) - 1
+    texto = (descripcion + " " * relleno + "\n").encode("latin1")
+    return np.lib.format.MAGIC_PREFIX + bytes([1, 0]) + len(texto).to_bytes(2, "little") + texto
+
+# ====================================================================================================
+# LECTOR COLUMNAR (MAPEADO EN MEMORIA)
+# ====================================================================================================
+# Abre las columnas con np.load(mmap_mode="r"); nada se lee del disco hasta que se usa. resultados[i] regresa un
+# ResultadoColas cuyo Pn es una vista del archivo, y columna("Wq") el arreglo completo de una métrica.
+class ResultadosColumnares:
+    def __init__(self, directorio):
+        self.directorio = directorio
+        self._columnas = {
+            nombre: np.load(os.path.join(directorio, f"{nombre}.npy"), mmap_mode="r")
+            for nombre in ARCHIVOS
+        }
+
+    def __len__(self):
+        return len(self._columnas["modelo"])
+
+    # columna: Arreglo (mapeado en memoria) de una columna escalar, o de Pn_valores / Pn_inicios.
+    def columna(self, nombre):
+        return self._columnas[nombre]
+
+    # Pn: Vista de las probabilidades de la fila i.
+    def Pn(self, i):
+        inicios = self._columnas["Pn_inicios"]
+        return self._columnas["Pn_valores"][inicios[i]:inicios[i + 1]]
+
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        i %= len(self)
+        c = self._columnas
+        return ResultadoColas(
+            MODELOS[c["modelo"][i]], float(c["lambd"][i]), float(c["mu"][i]), int(c["s"][i]),
+            *(float(c[campo][i]) for campo in CLAVES), self.Pn(i)
+        )
+
+
+# guardar_resultados: Escribe una secuencia de ResultadoColas en el directorio.
+def guardar_resultados(directorio, resultados):
+    with EscritorColumnar(directorio) as escritor:
+        for resultado in resultados:
+            escritor.agregar(resultado)
+
+# cargar_resultados: Abre un directorio escrito por EscritorColumnar.
+def cargar_resultados(directorio):
+    return ResultadosColumnares(directorio)
@@ -0,0 +1,142 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# ANALISIS DE SENSIBILIDAD [MODELO MM1 - MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Calcular las derivadas parciales exactas de Ls, Lq, Ws, Wq y P(esperar)
+#     respecto a λ y μ, sin diferencias finitas.
+#   - Calcular las elasticidades (∂M/∂x)·x/M para gráficas de elasticidad.
+#   - Calcular los cambios discretos al agregar o quitar un servidor (c ± 1).
+#   - Hacerlo en una sola pasada de Erlang-B y sobre arreglos (mapas de calor).
+#
+# Todo sale de B = Erlang-B(c, a) con a = λ/μ:
+#   dB/da  = B·(c/a - 1 + B)
+#   C      = c·B / (c - a·(1 - B))             (Erlang-C, P(esperar))
+#   Lq     = C·a / (c - a),  Wq = C / (cμ - λ)
+#   B(c+1) = a·B / (c + 1 + a·B),  B(c-1) = c·B / (a·(1 - B))
+# y la regla de la cadena con ∂a/∂λ = 1/μ y ∂a/∂μ = -a/μ.
+
+import numpy as np
+from utils import _erlang_b_batch
+
+
+METRICAS = ("Ls", "Lq", "Ws", "Wq", "P_espera")
+
+
+# ====================================================================================================
+# SENSIBILIDAD MMc (VECTORIZADA)
+# ====================================================================================================
+# mmc_sensibilidad_batch: Recibe arreglos (o escalares) de λ, μ y c. Regresa las métricas, sus derivadas respecto a λ
+# y μ, las elasticidades y los cambios al pasar a c + 1 y c - 1 servidores. Los puntos inestables quedan en NaN y se
+# marcan en las máscaras "estable", "estable c+1" y "estable c-1".
+def mmc_sensibilidad_batch(lambd, mu, s):
+    lambd, mu, s = np.broadcast_arrays(
+        np.asarray(lambd, dtype=float), np.asarray(mu, dtype=float), np.asarray(s, dtype=np.int64)
+    )
+    a = lambd / mu
+    estable = (s >= 1) & (a < s)
+    a = np.where(estable, a, np.nan)
+    B = _erlang_b_batch(np.where(estable, s, 0), np.where(estable, a, 0.0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metricas = _metricas_erlang(s, a, mu, B)
+
+        # dB/da; en a = 0 el límite es 1 si c = 1 y 0 si c > 1.
+        dB = np.where(a > 0, B * (s / a - 1 + B), (s == 1).astype(float))
+        D = s - a * (1 - B)
+        dD = -(1 - B) + a * dB
+        dC = s * (dB * D - B * dD) / D**2
+
+        C = metricas["P_espera"]
+        Wq = metricas["Wq"]
+        dLq = dC * a / (s - a) + C * s / (s - a)**2
+        dWq = dC / (mu * (s - a)) + C / (mu * (s - a)**2)
+
+        # ∂/∂λ = (∂/∂a)/μ y ∂/∂μ = (∂/∂a)·(-a/μ); Wq y Ws dependen además de μ directamente (Wq = C/(μ(c - a))).
+        derivadas = {
+            "lambda": {
+                "Ls": (dLq + 1) / mu,
+                "Lq": dLq / mu,
+                "Ws": dWq / mu,
+                "Wq": dWq / mu,
+                "P_espera": dC / mu
+            },
+            "mu": {
+                "Ls": -(dLq + 1) * a / mu,
+                "Lq": -dLq * a / mu,
+                "Ws": -dWq * a / mu - Wq / mu - 1 / mu**2,
+                "Wq": -dWq * a / mu - Wq / mu,
+                "P_espera": -dC * a / mu
+            }
+        }
+        elasticidades = {
+            variable: {nombre: derivadas[variable][nombre] * valor / metricas[nombre] for nombre in METRICAS}
+            for variable, valor in (("lambda", lambd), ("mu", mu))
+        }
+
+        # Un servidor más / uno menos con la recurrencia de Erlang-B hacia adelante y hacia atrás.
+        B_mas = a * B / (s + 1 + a * B)
+        mas = _metricas_erlang(s + 1, a, mu, B_mas)
+        estable_menos = estable & (a < s - 1)
+        # En a = 0 la fórmula da 0/0; sin tráfico B(c-1) = 0.
+        B_menos = np.where(estable_menos, np.where(a > 0, s * B / (a * (1 - B)), 0.0), np.nan)
+        menos = _metricas_erlang(s - 1, a, mu, B_menos)
+
+    metricas = {nombre: np.where(estable, valor, np.nan) for nombre, valor in metricas.items()}
+    return {
+        **metricas,
+        "derivadas": {v: {n: np.where(estable, d, np.nan) for n, d in ds.items()} for v, ds in derivadas.items()},
+        "elasticidades": {v: {n: np.where(estable, e, np.nan) for n, e in es.items()} for v, es in elasticidades.items()},
+        "c+1": {nombre: np.where(estable, mas[nombre] - metricas[nombre], np.nan) for nombre in METRICAS},
+        "c-1": {nombre: np.where(estable_menos, menos[nombre] - metricas[nombre], np.nan) for nombre in METRICAS},
+        "estable": estable,
+        "estable c+1": estable,
+        "estable c-1": estable_menos
+    }
+
+# _metricas_erlang: Ls, Lq, Ws, Wq y P(esperar) a partir de c, a, μ y B = Erlang-B(c, a).
+def _metricas_erlang(s, a, mu, B):
+    C = s * B / (s - a * (1 - B))
+    Lq = C * a / (s - a)
+    Wq = C / (mu * (s - a))
+    return {"Ls": Lq + a, "Lq": Lq, "Ws": Wq + 1 / mu, "Wq": Wq, "P_espera": C}
+
+# ====================================================================================================
+# SENSIBILIDAD DE UN PUNTO
+# ====================================================================================================
+# mmc_sensibilidad: Versión de un solo punto; regresa los mismos diccionarios con flotantes, o el mensaje de error si
+# el sistema colapsa.
+def mmc_sensibilidad(lambd, mu, s):
+    if lambd / (s * mu) >= 1:
+        return "\nERROR: El sistema colapsa (ρ ≥ 1)."
+    return _a_flotantes(mmc_sensibilidad_batch(lambd, mu, s))
+
+def mm1_sensibilidad(lambd, mu):
+    if lambd >= mu:
+        return "\nERROR: El sistema colapsa (λ ≥ μ)."
+    return _a_flotantes(mmc_sensibilidad_batch(lambd, mu, 1))
+
+def _a_flotantes(resultado):
+    if isinstance(resultado, dict):
+        return {clave: _a_flotantes(valor) for clave, valor in resultado.items()}
+    return resultado.item()
@@ -0,0 +1,277 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# SIMULACION DE EVENTOS DISCRETOS [MODELO MM1 - MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Simular un sistema MM1 o MMc (FIFO) para validar las fórmulas de utils.py.
+#   - Atender a los clientes con un heap de tiempos libres de los servidores.
+#   - Guardar los registros de clientes en arreglos de NumPy (llegada, inicio, salida).
+#   - Obtener las mismas métricas que mmc_metrics con intervalos de confianza
+#     por el método de medias por lotes.
+#   - Ejecutar réplicas independientes en paralelo con flujos aleatorios reproducibles.
+
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heapreplace
+from math import sqrt
+import os
+import numpy as np
+
+
+# Valores críticos t de Student (dos colas, 95%) para gl = 1..30; arriba de 30 se usa 1.96.
+T_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+)
+
+CLAVES_ESCALARES = (
+    "rho (factor de uso)",
+    "Ls (clientes esperados en el sistema)",
+    "Lq (clientes esperados en la cola)",
+    "Ws (tiempo esperado en el sistema)",
+    "Wq (tiempo esperado en la cola)",
+    "c_bar (servidores ocupados)",
+    "P0 (probabilidad del sistema vacío)"
+)
+
+
+# ====================================================================================================
+# SIMULACION MM1
+# ====================================================================================================
+def simular_mm1(lambd, mu, n_max, n_clientes=100_000, calentamiento=0.1, lotes=20, semilla=None):
+    if lambd >= mu:
+        return "\nERROR: El sistema colapsa (λ ≥ μ)."
+    error = _validar_corrida(n_clientes, calentamiento, lotes)
+    if error:
+        return error
+
+    resultado = _simular(lambd, mu, 1, n_max, n_clientes, calentamiento, lotes, semilla)
+    del resultado["c_bar (servidores ocupados)"]
+    del resultado["IC (intervalos de confianza 95%)"]["c_bar (servidores ocupados)"]
+    return resultado
+
+# ====================================================================================================
+# SIMULACION MMc
+# ====================================================================================================
+def simular_mmc(lambd, mu, s, n_max, n_clientes=100_000, calentamiento=0.1, lotes=20, semilla=None):
+    if lambd / (s * mu) >= 1:
+        return "\nERROR: El sistema colapsa (ρ ≥ 1)."
+    error = _validar_corrida(n_clientes, calentamiento, lotes)
+    if error:
+        return error
+
+    return _simular(lambd, mu, s, n_max, n_clientes, calentamiento, lotes, semilla)
+
+# ====================================================================================================
+# REPLICAS INDEPENDIENTES EN PARALELO
+# ====================================================================================================
+# Reparte las réplicas en un pool de procesos. Cada réplica recibe su propio flujo aleatorio derivado de
+# SeedSequence(semilla).spawn(...), así que los resultados no dependen del número de procesos. Las
+# estimaciones se combinan en línea (Welford) conforme llegan, en el mismo orden en que se enviaron.
+def ejecutar_replicas(lambd, mu, s, n_max, replicas=10, semilla=None, procesos=None,
+                      n_clientes=100_000, calentamiento=0.1):
+    if lambd / (s * mu) >= 1:
+        return "\nERROR: El sistema colapsa (ρ ≥ 1)."
+    if replicas < 1:
+        return "\nERROR: Se necesita al menos una réplica."
+    error = _validar_corrida(n_clientes, calentamiento, 1)
+    if error:
+        return error
+
+    hijas = np.random.SeedSequence(semilla).spawn(replicas)
+    parametros = [(lambd, mu, s, n_max, n_clientes, calentamiento, hija) for hija in hijas]
+    estadisticas = {clave: EstadisticaEnLinea() for clave in CLAVES_ESCALARES + ("Pn",)}
+
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        _combinar(estadisticas, map(_replica, parametros))
+    else:
+        trozo = max(1, replicas // (4 * procesos))
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            _combinar(estadisticas, pool.map(_replica, parametros, chunksize=trozo))
+
+    resultado = {clave: float(estadisticas[clave].media) for clave in CLAVES_ESCALARES}
+    resultado["Pn"] = estadisticas["Pn"].media.tolist()
+    resultado["IC (intervalos de confianza 95%)"] = {
+        clave: estadisticas[clave].intervalo_confianza() for clave in CLAVES_ESCALARES
+    }
+    resultado["replicas"] = replicas
+    return resultado
+
+# EstadisticaEnLinea: Media y varianza acumuladas con el algoritmo de Welford; acepta escalares o arreglos.
+class EstadisticaEnLinea:
+    __slots__ = ("n", "media", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def agregar(self, x):
+        self.n += 1
+        delta = x - self.media
+        self.media = self.media + delta / self.n
+        self.m2 = self.m2 + delta * (x - self.media)
+
+    def varianza(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def intervalo_confianza(self):
+        if self.n < 2:
+            return (float(self.media), float(self.media))
+        t = T_95[self.n - 2] if self.n - 1 <= len(T_95) else 1.96
+        margen = t * sqrt(self.varianza() / self.n)
+        return (float(self.media - margen), float(self.media + margen))
+
+# _replica: Una réplica completa; regresa solo las estimaciones puntuales para mandar poco entre procesos.
+def _replica(parametros):
+    lambd, mu, s, n_max, n_clientes, calentamiento, semilla = parametros
+    resultado = _simular(lambd, mu, s, n_max, n_clientes, calentamiento, 1, semilla)
+    resultado["Pn"] = np.asarray(resultado["Pn"])
+    return resultado
+
+# _combinar: Agrega cada estimación a su acumulador en cuanto llega.
+def _combinar(estadisticas, estimaciones):
+    for estimacion in estimaciones:
+        for clave, estadistica in estadisticas.items():
+            estadistica.agregar(estimacion[clave])
+
+# ====================================================================================================
+# MOTOR DE SIMULACION
+# ====================================================================================================
+# _validar_corrida: Mensaje de error si la corrida no deja al menos dos clientes observados y uno por lote
+# (con menos, la ventana de observación mide 0 o algún lote queda vacío); None si los parámetros sirven.
+def _validar_corrida(n_clientes, calentamiento, lotes):
+    if not 0 <= calentamiento < 1 or lotes < 1:
+        return "\nERROR: Se necesita 0 ≤ calentamiento < 1 y al menos un lote."
+    if n_clientes - int(n_clientes * calentamiento) < max(lotes, 2):
+        return "\nERROR: Hay muy pocos clientes observados para el número de lotes."
+    return None
+
+# _simular: Genera llegadas y servicios exponenciales, atiende a los clientes y resume la corrida.
+# La semilla puede ser un entero, un SeedSequence o un Generator de NumPy.
+def _simular(lambd, mu, s, n_max, n_clientes, calentamiento, lotes, semilla):
+    if lambd <= 0:
+        return _sistema_vacio(mu, n_max)
+
+    rng = np.random.default_rng(semilla)
+    llegadas = np.cumsum(rng.exponential(1 / lambd, n_clientes))
+    servicios = rng.exponential(1 / mu, n_clientes)
+    clientes = atender_fifo(llegadas, servicios, s)
+
+    primero = int(n_clientes * calentamiento)
+    inicio_obs = clientes["llegada"][primero]
+    fin_obs = clientes["llegada"][-1]
+    fronteras = np.linspace(inicio_obs, fin_obs, lotes + 1)
+
+    # Estados n(t) del sistema y de la cola como funciones escalonadas.
+    t_sis, n_sis = _escalonada(clientes["llegada"], clientes["salida"])
+    t_cola, n_cola = _escalonada(clientes["llegada"], clientes["inicio"])
+
+    tiempo_por_estado = _tiempo_por_estado(t_sis, n_sis, inicio_obs, fin_obs, n_max)
+    Pn = tiempo_por_estado / (fin_obs - inicio_obs)
+
+    # Medias por lote: promedios temporales en intervalos iguales y promedios por cliente en grupos iguales.
+    Ls_lotes = _promedio_temporal(t_sis, n_sis, fronteras)
+    Lq_lotes = _promedio_temporal(t_cola, n_cola, fronteras)
+    ocupados_lotes = _promedio_temporal(t_sis, np.minimum(n_sis, s), fronteras)
+    P0_lotes = _promedio_temporal(t_sis, (n_sis == 0).astype(float), fronteras)
+
+    observados = clientes[primero:]
+    grupos = np.array_split(np.arange(observados.size), lotes)
+    Ws_lotes = np.array([(observados["salida"][g] - observados["llegada"][g]).mean() for g in grupos])
+    Wq_lotes = np.array([(observados["inicio"][g] - observados["llegada"][g]).mean() for g in grupos])
+
+    por_lote = dict(zip(CLAVES_ESCALARES, (
+        ocupados_lotes / s, Ls_lotes, Lq_lotes, Ws_lotes, Wq_lotes, ocupados_lotes, P0_lotes
+    )))
+
+    resultado = {clave: float(valores.mean()) for clave, valores in por_lote.items()}
+    resultado["Pn"] = Pn.tolist()
+    resultado["IC (intervalos de confianza 95%)"] = {
+        clave: intervalo_confianza(valores) for clave, valores in por_lote.items()
+    }
+    return resultado
+
+# _sistema_vacio: Resultado exacto cuando no llegan clientes (λ = 0): el sistema siempre está vacío y un cliente
+# hipotético solo esperaría su servicio (Ws = 1/μ), igual que mmc_metrics. Los intervalos no tienen ancho.
+def _sistema_vacio(mu, n_max):
+    resultado = dict.fromkeys(CLAVES_ESCALARES, 0.0)
+    resultado["Ws (tiempo esperado en el sistema)"] = 1 / mu
+    resultado["P0 (probabilidad del sistema vacío)"] = 1.0
+    resultado["Pn"] = [1.0] + [0.0] * n_max if n_max >= 0 else []
+    resultado["IC (intervalos de confianza 95%)"] = {
+        clave: (resultado[clave], resultado[clave]) for clave in CLAVES_ESCALARES
+    }
+    return resultado
+
+# atender_fifo: Atiende a los clientes en orden de llegada con c servidores. El heap guarda el instante
+# en que cada servidor queda libre, así que cada cliente cuesta O(log c). Regresa un arreglo estructurado
+# con los registros (llegada, inicio, salida) de cada cliente. Si se pasa el heap "libres" de una llamada
+# anterior, la atención continúa donde se quedó (se modifica en su lugar).
+def atender_fifo(llegadas, servicios, s, libres=None):
+    clientes = np.empty(len(llegadas), dtype=[("llegada", "f8"), ("inicio", "f8"), ("salida", "f8")])
+    inicios = [0.0] * len(llegadas)
+    if libres is None:
+        libres = [0.0] * s
+
+    for i, (t, d) in enumerate(zip(llegadas.tolist(), servicios.tolist())):
+        libre = libres[0]
+        comienzo = t if t > libre else libre
+        heapreplace(libres, comienzo + d)
+        inicios[i] = comienzo
+
+    clientes["llegada"] = llegadas
+    clientes["inicio"] = inicios
+    clientes["salida"] = clientes["inicio"] + servicios
+    return clientes
+
+# intervalo_confianza: Intervalo t de Student al 95% para la media de observaciones independientes.
+def intervalo_confianza(valores):
+    k = len(valores)
+    media = float(np.mean(valores))
+    if k < 2:
+        return (media, media)
+    t = T_95[k - 2] if k - 1 <= len(T_95) else 1.96
+    margen = t * float(np.std(valores, ddof=1)) / sqrt(k)
+    return (media - margen, media + margen)
+
+# _escalonada: Convierte entradas (+1) y salidas (-1) en una función escalonada ordenada en el tiempo.
+def _escalonada(entradas, salidas):
+    tiempos = np.concatenate((entradas, salidas))
+    cambios = np.concatenate((np.ones(len(entradas)), -np.ones(len(salidas))))
+    orden = np.argsort(tiempos, kind="stable")
+    return tiempos[orden], np.cumsum(cambios[orden])
+
+# _promedio_temporal: Promedio temporal de una función escalonada en cada intervalo entre fronteras.
+def _promedio_temporal(tiempos, niveles, fronteras):
+    area = np.concatenate(([0.0], np.cumsum(niveles[:-1] * np.diff(tiempos))))
+    k = np.searchsorted(tiempos, fronteras, side="right") - 1
+    area_hasta = area[k] + niveles[k] * (fronteras - tiempos[k])
+    return np.diff(area_hasta) / np.diff(fronteras)
+
+# _tiempo_por_estado: Tiempo total que el sistema pasa con n = 0..n_max clientes dentro de [inicio, fin].
+def _tiempo_por_estado(tiempos, niveles, inicio, fin, n_max):
+    duraciones = np.clip(np.minimum(tiempos[1:], fin) - np.maximum(tiempos[:-1], inicio), 0, None)
+    dentro = niveles[:-1] <= n_max
+    return np.bincount(niveles[:-1][dentro].astype(np.int64), weights=duraciones[dentro], minlength=n_max + 1)
@@ -0,0 +1,111 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# SUPERFICIE DE METRICAS PRECALCULADA [MODELO MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Calcular de una vez, con mmc_metrics_batch, las métricas sobre una malla
+#     λ × μ × c (una sola llamada vectorizada).
+#   - Responder consultas en puntos intermedios por interpolación bilineal en
+#     (λ, μ) sobre la rebanada del c pedido, sin volver a calcular.
+#   - Dar las curvas (por ejemplo Ws y Wq contra λ) y los mapas de calor (λ × μ)
+#     que usa el panel de barrido (barrido.py).
+#
+# No depende de la interfaz, así que se puede construir en un hilo de trabajo.
+
+import numpy as np
+from utils import mmc_metrics_batch
+
+
+# Atributo corto -> llave de mmc_metrics_batch.
+CLAVES = {
+    "rho": "rho (factor de uso)",
+    "Ls": "Ls (clientes esperados en el sistema)",
+    "Lq": "Lq (clientes esperados en la cola)",
+    "Ws": "Ws (tiempo esperado en el sistema)",
+    "Wq": "Wq (tiempo esperado en la cola)",
+    "P0": "P0 (probabilidad del sistema vacío)"
+}
+
+
+# ====================================================================================================
+# SUPERFICIE DE METRICAS
+# ====================================================================================================
+# Malla de n_lambda × n_mu puntos equiespaciados para cada c entero en [c_min, c_max]. Cada métrica se guarda como un
+# arreglo (n_lambda, n_mu, n_c); los puntos inestables quedan en NaN.
+class SuperficieMetricas:
+    def __init__(self, lambdas, mus, servidores, n_lambda=120, n_mu=120):
+        lambda_min, lambda_max = sorted(map(float, lambdas))
+        mu_min, mu_max = sorted(map(float, mus))
+        c_min, c_max = sorted(map(int, servidores))
+        if lambda_min < 0 or mu_min <= 0 or c_min < 1:
+            raise ValueError("Se necesita λ ≥ 0, μ > 0 y c ≥ 1.")
+
+        self.lambdas = np.linspace(lambda_min, lambda_max, n_lambda if lambda_max > lambda_min else 1)
+        self.mus = np.linspace(mu_min, mu_max, n_mu if mu_max > mu_min else 1)
+        self.servidores = np.arange(c_min, c_max + 1)
+
+        lote = mmc_metrics_batch(self.lambdas[:, None, None], self.mus[None, :, None], self.servidores[None, None, :], 0)
+        self.metricas = {campo: lote[clave] for campo, clave in CLAVES.items()}
+        self.estable = lote["estable"]
+
+    # interpolar: Valor de la métrica en (λ, μ, c) por interpolación bilineal; λ y μ pueden ser arreglos (se difunden).
+    # c se redondea al entero más cercano de la malla y los valores fuera del rango se acotan al borde. Las esquinas
+    # con peso 0 no cuentan, así que un nodo estable junto a uno inestable conserva su valor; el resultado es NaN solo
+    # si alguna esquina con peso es inestable.
+    def interpolar(self, metrica, lambd, mu, s):
+        valores = self.metricas[metrica][..., self._indice_c(s)]
+        i, t = _posicion(self.lambdas, lambd)
+        j, u = _posicion(self.mus, mu)
+        i1 = np.minimum(i + 1, len(self.lambdas) - 1)
+        j1 = np.minimum(j + 1, len(self.mus) - 1)
+        esquinas = (
+            ((1 - t) * (1 - u), valores[i, j]), (t * (1 - u), valores[i1, j]),
+            ((1 - t) * u, valores[i, j1]), (t * u, valores[i1, j1])
+        )
+        return sum(np.where(peso > 0, peso * valor, 0.0) for peso, valor in esquinas)
+
+    # curva_lambda: Métrica contra los λ de la malla con μ y c fijos (interpolando solo en μ).
+    def curva_lambda(self, metrica, mu, s):
+        return self.lambdas, self.interpolar(metrica, self.lambdas, mu, s)
+
+    # curva_mu: Métrica contra los μ de la malla con λ y c fijos (interpolando solo en λ).
+    def curva_mu(self, metrica, lambd, s):
+        return self.mus, self.interpolar(metrica, lambd, self.mus, s)
+
+    # mapa: Rebanada (n_lambda, n_mu) de la métrica para el c dado, para un mapa de calor.
+    def mapa(self, metrica, s):
+        return self.metricas[metrica][..., self._indice_c(s)]
+
+    def _indice_c(self, s):
+        return int(np.clip(round(s) - self.servidores[0], 0, len(self.servidores) - 1))
+
+
+# _posicion: Índice de la celda y fracción dentro de ella para x en una malla equiespaciada (acotado a la malla).
+def _posicion(malla, x):
+    x = np.asarray(x, dtype=float)
+    if len(malla) == 1:
+        return np.zeros(x.shape, dtype=np.intp), np.zeros(x.shape)
+    paso = malla[1] - malla[0]
+    f = np.clip((x - malla[0]) / paso, 0, len(malla) - 1)
+    i = np.minimum(f.astype(np.intp), len(malla) - 2)
+    return i, f - i
@@ -0,0 +1,142 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ====================================================================================================
+# TABLA VIRTUAL DE PROBABILIDADES Pn
+# ====================================================================================================
+# Solo se da formato a las filas visibles, así que mostrar 10^5 o más estados cuesta lo mismo que
+# mostrar una página. Incluye navegación por páginas, rueda del ratón, salto a un n y filas de resumen
+# con la probabilidad de la cola.
+
+import numpy as np
+import customtkinter as ctk
+
+
+FILAS_POR_PAGINA = 10
+
+
+# ====================================================================================================
+# PREPARAR DATOS DE LA TABLA
+# ====================================================================================================
+# preparar_tabla: Convierte Pn a arreglo y calcula la acumulada P(N ≤ n) y la cola P(N > n). Es la única parte O(n) y
+# se puede llamar desde el hilo de trabajo para no bloquear la ventana. La cola se suma desde el final para que las
+# probabilidades muy pequeñas no se pierdan al restar de 1.
+def preparar_tabla(Pn):
+    Pn = np.asarray(Pn, dtype=float)
+    acumulada = np.cumsum(Pn)
+    cola = np.zeros(len(Pn))
+    if len(Pn):
+        resto = max(0.0, 1 - float(acumulada[-1]))
+        cola[:-1] = np.cumsum(Pn[:0:-1])[::-1]
+        cola += resto
+    return Pn, acumulada, cola
+
+# ====================================================================================================
+# TABLA VIRTUAL
+# ====================================================================================================
+class TablaPn(ctk.CTkFrame):
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, fg_color="transparent", **kwargs)
+
+        self._Pn = np.zeros(0)
+        self._acumulada = np.zeros(0)
+        self._cola = np.zeros(0)
+        self._inicio = 0
+
+        self.texto = ctk.CTkTextbox(self, height=240, font=ctk.CTkFont(family="Courier", size=14), wrap="none")
+        self.texto.pack(padx=10, pady=5, fill="x")
+        self.texto.configure(state="disabled")
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.texto.bind(evento, self._rueda)
+
+        navegacion = ctk.CTkFrame(self, fg_color="transparent")
+        navegacion.pack(padx=10, pady=5, fill="x")
+
+        ctk.CTkButton(navegacion, text="◀", width=40, command=lambda: self.ir_a(self._inicio - FILAS_POR_PAGINA)).pack(side="left", padx=2)
+        ctk.CTkButton(navegacion, text="▶", width=40, command=lambda: self.ir_a(self._inicio + FILAS_POR_PAGINA)).pack(side="left", padx=2)
+
+        self.label_rango = ctk.CTkLabel(navegacion, text="---")
+        self.label_rango.pack(side="left", padx=10)
+
+        ctk.CTkButton(navegacion, text="Ir", width=40, command=self._saltar).pack(side="right", padx=2)
+        self.entry_salto = ctk.CTkEntry(navegacion, width=90, placeholder_text="n")
+        self.entry_salto.pack(side="right", padx=2)
+        self.entry_salto.bind("<Return>", lambda evento: self._saltar())
+        ctk.CTkLabel(navegacion, text="Ir a n:").pack(side="right", padx=5)
+
+        self.label_resumen = ctk.CTkLabel(self, text="", anchor="w", justify="left")
+        self.label_resumen.pack(padx=10, pady=(0, 5), fill="x")
+
+    # mostrar: Carga una nueva distribución (Pn o la tupla ya preparada con preparar_tabla) y muestra la primera página.
+    def mostrar(self, Pn, acumulada=None, cola=None):
+        if acumulada is None or cola is None:
+            Pn, acumulada, cola = preparar_tabla(Pn)
+        self._Pn = Pn
+        self._acumulada = acumulada
+        self._cola = cola
+
+        n_max = len(Pn) - 1
+        self.label_resumen.configure(
+            text=f"P(N ≤ {n_max}) = {acumulada[-1] * 100:.4f}%      P(N > {n_max}) = {cola[-1] * 100:.4g}%"
+            if len(Pn) else ""
+        )
+        self.ir_a(0)
+
+    # limpiar: Deja la tabla vacía.
+    def limpiar(self):
+        self.mostrar(np.zeros(0), np.zeros(0), np.zeros(0))
+
+    # ir_a: Muestra la página que empieza en la fila n (acotada al rango válido) formateando solo esas filas.
+    def ir_a(self, n):
+        ultimo_inicio = max(0, len(self._Pn) - FILAS_POR_PAGINA)
+        self._inicio = min(max(0, int(n)), ultimo_inicio)
+        fin = min(self._inicio + FILAS_POR_PAGINA, len(self._Pn))
+
+        filas = [
+            f"P{i:<8} = {self._Pn[i] * 100:>8.4f}%    P(N ≤ {i}) = {self._acumulada[i] * 100:>8.4f}%"
+            for i in range(self._inicio, fin)
+        ]
+        if fin > self._inicio:
+            filas.append(f"{'':<10}   P(N > {fin - 1}) = {self._cola[fin - 1] * 100:.4g}%")
+
+        self.texto.configure(state="normal")
+        self.texto.delete("1.0", "end")
+        self.texto.insert("1.0", "\n".join(filas))
+        self.texto.configure(state="disabled")
+
+        self.label_rango.configure(
+            text=f"n = {self._inicio} … {fin - 1} de {len(self._Pn) - 1}" if fin > self._inicio else "---"
+        )
+
+    def _saltar(self):
+        try:
+            self.ir_a(int(self.entry_salto.get()))
+        except ValueError:
+            pass
+
+    # _rueda: Desplaza la ventana de filas con la rueda del ratón en lugar de mover el contenido del textbox.
+    def _rueda(self, evento):
+        paso = 3
+        if getattr(evento, "num", None) == 4 or getattr(evento, "delta", 0) > 0:
+            self.ir_a(self._inicio - paso)
+        else:
+            self.ir_a(self._inicio + paso)
+        return "break"
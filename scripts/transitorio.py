@@ -0,0 +1,112 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# ANALISIS TRANSITORIO [MODELO MM1 - MMc]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Obtener P(n, t), Ls(t) y Lq(t) en una malla de tiempos, no solo el estado estable.
+#   - Truncar el espacio de estados en K clientes (funciona también con ρ ≥ 1).
+#   - Usar uniformización: π(t) = Σ_k Poisson(k; Λt)·π(0)·P^k con P = I + Q/Λ.
+#     Los productos π(0)·P^k se calculan una sola vez y se reparten entre todos los
+#     tiempos pedidos, así que 1000 tiempos cuestan poco más que el tiempo mayor.
+
+from math import lgamma
+import numpy as np
+
+
+# ====================================================================================================
+# TRANSITORIO MM1
+# ====================================================================================================
+def transitorio_mm1(lambd, mu, tiempos, K, n0=0, p0=None, z=8.0):
+    return transitorio_mmc(lambd, mu, 1, tiempos, K, n0, p0, z)
+
+# ====================================================================================================
+# TRANSITORIO MMc
+# ====================================================================================================
+# n0: número inicial de clientes (se ignora si se da la distribución inicial p0 con K+1 valores).
+# z: desviaciones estándar de la Poisson que se conservan a cada lado de Λt (8 deja fuera < 1e-15).
+def transitorio_mmc(lambd, mu, s, tiempos, K, n0=0, p0=None, z=8.0):
+    if K < s:
+        return "\nERROR: La capacidad K debe ser al menos el número de servidores c."
+
+    tiempos = np.asarray(tiempos, dtype=float)
+    if np.any(tiempos < 0):
+        return "\nERROR: Los tiempos deben ser no negativos."
+
+    n = np.arange(K + 1)
+    nacimientos = np.where(n < K, float(lambd), 0.0)
+    muertes = mu * np.minimum(n, s).astype(float)
+    uniformizacion = float(lambd + s * mu)
+
+    if p0 is None:
+        v = np.zeros(K + 1)
+        v[min(n0, K)] = 1.0
+    else:
+        v = np.array(p0, dtype=float)
+        v /= v.sum()
+
+    # Pasos de la matriz P = I + Q/Λ (tridiagonal): quedarse, subir y bajar.
+    quedarse = 1 - (nacimientos + muertes) / uniformizacion
+    subir = nacimientos[:-1] / uniformizacion
+    bajar = muertes[1:] / uniformizacion
+
+    orden = np.argsort(tiempos, kind="stable")
+    t_ord = tiempos[orden]
+    media = uniformizacion * t_ord
+    izquierda = np.maximum(0, np.floor(media - z * np.sqrt(media))).astype(np.int64)
+    derecha = np.ceil(media + z * np.sqrt(media) + z).astype(np.int64)
+    with np.errstate(divide="ignore"):
+        log_media = np.log(media)
+
+    acumulado = np.zeros((len(t_ord), K + 1))
+    pesos = np.zeros(len(t_ord))
+    k_max = int(derecha.max()) if len(t_ord) else -1
+
+    # Como izquierda y derecha crecen con t, los tiempos activos en el paso k forman un rango contiguo [a, b).
+    a = b = 0
+    for k in range(k_max + 1):
+        while b < len(t_ord) and izquierda[b] <= k:
+            b += 1
+        while a < b and derecha[a] < k:
+            a += 1
+
+        if a < b:
+            with np.errstate(invalid="ignore"):
+                log_w = -media[a:b] + k * log_media[a:b] - lgamma(k + 1)
+            w = np.exp(np.where(media[a:b] > 0, log_w, 0.0 if k == 0 else -np.inf))
+            acumulado[a:b] += w[:, None] * v[None, :]
+            pesos[a:b] += w
+
+        siguiente = v * quedarse
+        siguiente[1:] += v[:-1] * subir
+        siguiente[:-1] += v[1:] * bajar
+        v = siguiente
+
+    Pn = np.empty_like(acumulado)
+    Pn[orden] = acumulado / pesos[:, None]
+    return {
+        "tiempos": tiempos,
+        "Ls (clientes esperados en el sistema)": Pn @ n,
+        "Lq (clientes esperados en la cola)": Pn @ np.maximum(n - s, 0),
+        "P0 (probabilidad del sistema vacío)": Pn[:, 0],
+        "Pn": Pn
+    }
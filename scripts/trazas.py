@@ -0,0 +1,124 @@
+# MIT License
+# Copyright (c) 2025 Elizabeth Becerril y Sofía Becerril
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# =================================================================================
+# REPRODUCCION DE TRAZAS [COLA FIFO CON c SERVIDORES]
+# =================================================================================
+# Este programa tiene como objetivo realizar lo siguiente:
+#   - Leer trazas reales (instante de llegada, duración del servicio) por bloques,
+#     desde CSV o desde un binario float64 mapeado en memoria.
+#   - Reproducirlas en una cola FIFO con c servidores guardando solo O(c) estado
+#     (el heap de instantes en que cada servidor queda libre).
+#   - Emitir estadísticas acumuladas de Ls, Lq, Ws y Wq después de cada bloque.
+#   - Comparar la traza contra la predicción markoviana de mmc_metrics.
+
+import csv
+from itertools import islice
+import numpy as np
+from simulacion import atender_fifo
+from utils import mmc_metrics
+
+
+# ====================================================================================================
+# LECTURA POR BLOQUES
+# ====================================================================================================
+# leer_csv_por_bloques: Lee un CSV con columnas (llegada, servicio) y regresa bloques de arreglos.
+def leer_csv_por_bloques(ruta, tamano_bloque=100_000, columnas=(0, 1), encabezado=True):
+    col_llegada, col_servicio = columnas
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        lector = csv.reader(archivo)
+        if encabezado:
+            next(lector, None)
+        while True:
+            filas = list(islice(lector, tamano_bloque))
+            if not filas:
+                return
+            llegadas = np.array([fila[col_llegada] for fila in filas], dtype=float)
+            servicios = np.array([fila[col_servicio] for fila in filas], dtype=float)
+            yield llegadas, servicios
+
+# leer_binario_por_bloques: Lee un binario de pares float64 (llegada, servicio) mapeado en memoria;
+# el sistema operativo solo carga las páginas del bloque que se está procesando.
+def leer_binario_por_bloques(ruta, tamano_bloque=1_000_000):
+    datos = np.memmap(ruta, dtype="<f8", mode="r")
+    pares = datos[:datos.size - datos.size % 2].reshape(-1, 2)
+    for inicio in range(0, len(pares), tamano_bloque):
+        bloque = pares[inicio:inicio + tamano_bloque]
+        yield np.array(bloque[:, 0]), np.array(bloque[:, 1])
+
+# ====================================================================================================
+# REPRODUCIR TRAZA
+# ====================================================================================================
+# reproducir_traza: Atiende cada bloque con atender_fifo, conservando el heap de servidores entre
+# bloques, y después de cada uno regresa las estadísticas acumuladas. Ls y Lq se obtienen con la ley
+# de Little (Σ tiempos / horizonte observado), así que no se guarda la traza en memoria.
+def reproducir_traza(bloques, s):
+    libres = [0.0] * s
+    clientes = 0
+    suma_Ws = 0.0
+    suma_Wq = 0.0
+    suma_servicio = 0.0
+    primera_llegada = None
+    ultima_llegada = -np.inf
+
+    for llegadas, servicios in bloques:
+        if len(llegadas) == 0:
+            continue
+        if llegadas[0] < ultima_llegada or np.any(np.diff(llegadas) < 0):
+            raise ValueError("Los instantes de llegada de la traza deben estar ordenados.")
+
+        registros = atender_fifo(llegadas, servicios, s, libres)
+        clientes += len(llegadas)
+        suma_Ws += float(np.sum(registros["salida"] - registros["llegada"]))
+        suma_Wq += float(np.sum(registros["inicio"] - registros["llegada"]))
+        suma_servicio += float(np.sum(servicios))
+        if primera_llegada is None:
+            primera_llegada = float(llegadas[0])
+        ultima_llegada = float(llegadas[-1])
+
+        horizonte = ultima_llegada - primera_llegada
+        with np.errstate(divide="ignore", invalid="ignore"):
+            yield {
+                "clientes": clientes,
+                "lambda (tasa de llegada observada)": np.divide(clientes, horizonte),
+                "mu (tasa de servicio observada)": clientes / suma_servicio,
+                "rho (factor de uso)": np.divide(suma_servicio, s * horizonte),
+                "Ls (clientes esperados en el sistema)": np.divide(suma_Ws, horizonte),
+                "Lq (clientes esperados en la cola)": np.divide(suma_Wq, horizonte),
+                "Ws (tiempo esperado en el sistema)": suma_Ws / clientes,
+                "Wq (tiempo esperado en la cola)": suma_Wq / clientes
+            }
+
+# ====================================================================================================
+# COMPARAR TRAZA CONTRA EL MODELO
+# ====================================================================================================
+# comparar_traza: Reproduce toda la traza y la compara con mmc_metrics evaluado en las tasas observadas.
+def comparar_traza(bloques, s):
+    final = None
+    for final in reproducir_traza(bloques, s):
+        pass
+
+    if final is None:
+        return "\nERROR: La traza está vacía."
+
+    lambd = float(final["lambda (tasa de llegada observada)"])
+    mu = float(final["mu (tasa de servicio observada)"])
+    return {"traza": final, "modelo": mmc_metrics(lambd, mu, s, 0)}
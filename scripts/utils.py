@@ -29,8 +29,8 @@
 #   - Obtener las métricas para cada sistema.
 #   - Obtener probabilidades n-ésimas para cada sistema.
 
-from math import factorial
-import matplotlib.pyplot as plt
+from math import exp, inf, lgamma, log, log1p, sqrt
+import numpy as np
 
 
 
@@ -47,7 +47,7 @@ def mm1_metrics(lambd, mu, n_max):
     Ws = 1 / (mu - lambd)
     Wq = rho / (mu - lambd)
     P0 = 1 - rho
-    Pn = [(1 - rho) * rho**n for n in range(n_max + 1)]
+    Pn = (P0 * rho ** np.arange(max(n_max + 1, 0))).tolist()
 
     return {
         "rho (factor de uso)": rho, 
@@ -68,16 +68,19 @@ def mmc_metrics(lambd, mu, s, n_max):
     if rho >= 1:
         return "\nERROR: El sistema colapsa (ρ ≥ 1)."
 
-    sum_terms = sum((lambd / mu)**n / factorial(n) for n in range(s))
-    last_term = ((lambd / mu)**s / (factorial(s) * (1 - rho)))
-    P0 = 1 / (sum_terms + last_term)
+    a = lambd / mu
+    log_suma, log_B = _log_erlang(s, a)
+    B = exp(log_B)
+    C = s * B / (s - a * (1 - B))
+    log_p0 = _log_p0_mmc(log_suma, rho, B)
+    P0 = exp(log_p0)
 
-    Lq = (P0 * ((lambd / mu)*s) * rho) / (factorial(s) * (1 - rho)*2)
-    Ls = Lq + lambd / mu
-    Wq = Lq / lambd
+    Lq = C * rho / (1 - rho)
+    Ls = Lq + a
+    Wq = C / (s * mu - lambd)
     Ws = Wq + 1 / mu
-    c_bar = lambd / mu
-    Pn = [((lambd / mu)**n / factorial(n)) * P0 if n < s else ((lambd / mu)**n / (factorial(s) * s**(n - s))) * P0 for n in range(n_max + 1)]
+    c_bar = a
+    Pn = pn_arreglo(lambd, mu, s, n_max).tolist()
 
     return {
         "rho (factor de uso)": rho, 
@@ -90,10 +93,356 @@ def mmc_metrics(lambd, mu, s, n_max):
         "Pn": Pn
     }
 
+# ====================================================================================================
+# MOTOR ERLANG (ESTABLE PARA MUCHOS SERVIDORES)
+# ====================================================================================================
+# erlang_b: Probabilidad de bloqueo de Erlang-B con la recurrencia B(k) = a·B(k-1) / (k + a·B(k-1)).
+# Solo usa flotantes en [0, 1], así que no se desborda aunque c sea de decenas de miles (O(c) pasos).
+def erlang_b(s, a):
+    B = 1.0
+    for k in range(1, s + 1):
+        aB = a * B
+        B = aB / (k + aB)
+    return B
+
+# erlang_c: Probabilidad de espera de Erlang-C, P(Wq > 0), obtenida a partir de Erlang-B.
+def erlang_c(s, a):
+    if a >= s:
+        return 1.0
+    B = erlang_b(s, a)
+    return s * B / (s - a * (1 - B))
+
+# _log_erlang: Regresa (log Σ_{k≤c} a^k/k!, log B) con B = Erlang-B(c, a) = (a^c/c!) / Σ. La suma se acumula en
+# espacio logarítmico (log-sum-exp), así que log B sigue siendo finito y exacto aunque B sea menor que el menor
+# flotante (a ≪ c). Si c ≥ a + 12·√a + 60 la cola de Poisson que falta pesa menos que e^-50, así que Σ = e^a.
+def _log_erlang(s, a):
+    if a == 0:
+        return 0.0, (0.0 if s == 0 else -inf)
+
+    log_a = log(a)
+    if s >= a + 12 * sqrt(a) + 60:
+        log_suma = a
+    else:
+        log_suma = 0.0
+        for k in range(1, s + 1):
+            log_t = k * log_a - lgamma(k + 1)
+            if log_t > log_suma:
+                log_suma = log_t + log1p(exp(log_suma - log_t))
+            else:
+                log_suma += log1p(exp(log_t - log_suma))
+    return log_suma, s * log_a - lgamma(s + 1) - log_suma
+
+# _log_p0_mmc: log P0 del modelo MMc: -log(Σ_{k≤c} a^k/k!) corregido por la cola geométrica de los estados n ≥ c,
+# 1 - B + B/(1-ρ) = 1 + B·ρ/(1-ρ).
+def _log_p0_mmc(log_suma, rho, B):
+    return -log_suma - log1p(B * rho / (1 - rho))
+
+# ====================================================================================================
+# PROBABILIDADES N POR RECURRENCIA
+# ====================================================================================================
+# pn_generador: Genera P0, P1, P2, ... de forma perezosa con la recurrencia P(n+1) = P(n)·a / min(n+1, c).
+# Se detiene al llegar a n_max o, si se indica tol, cuando la probabilidad restante P(N > n) es menor
+# que tol. Sin n_max ni tol el generador es infinito. Para MM1 basta con s=1.
+def pn_generador(lambd, mu, s=1, n_max=None, tol=None):
+    a = lambd / mu
+    rho = a / s
+
+    if rho >= 1:
+        raise ValueError("El sistema colapsa (ρ ≥ 1).")
+
+    if a == 0:
+        yield 1.0
+        n = 0
+        while tol is None and (n_max is None or n < n_max):
+            n += 1
+            yield 0.0
+        return
+
+    log_a = log(a)
+    log_s = log(s)
+    log_suma, log_B = _log_erlang(s, a)
+    log_p = _log_p0_mmc(log_suma, rho, exp(log_B))
+    acumulada = 0.0
+    n = 0
+
+    while True:
+        p = exp(log_p)
+        yield p
+
+        if n_max is not None and n >= n_max:
+            return
+
+        if tol is not None:
+            acumulada += p
+            # A partir de n = c-1 la cola es geométrica: P(N > n) = P(n)·ρ / (1 - ρ).
+            cola = p * rho / (1 - rho) if n + 1 >= s else 1 - acumulada
+            if cola < tol:
+                return
+
+        n += 1
+        log_p += log_a - (log(n) if n < s else log_s)
+
+# pn_arreglo: Versión vectorizada de pn_generador; regresa P0..P_{n_max} en un arreglo de NumPy
+# acumulando los logaritmos de los cocientes r(n) = a / min(n+1, c). Con n_max < 0 regresa un arreglo vacío.
+def pn_arreglo(lambd, mu, s, n_max):
+    a = lambd / mu
+    Pn = np.zeros(max(n_max + 1, 0))
+
+    if n_max < 0:
+        return Pn
+    if a == 0:
+        Pn[0] = 1.0
+        return Pn
+
+    n = np.arange(1, n_max + 1)
+    log_pn = np.empty(n_max + 1)
+    log_suma, log_B = _log_erlang(s, a)
+    log_pn[0] = _log_p0_mmc(log_suma, a / s, exp(log_B))
+    log_pn[1:] = log(a) - np.log(np.minimum(n, s))
+    return np.exp(np.cumsum(log_pn, out=log_pn))
+
+# ====================================================================================================
+# MODELO MM1K METRICAS (CAPACIDAD FINITA)
+# ====================================================================================================
+def mm1k_metrics(lambd, mu, K, n_max):
+    if K < 1:
+        return "\nERROR: La capacidad K debe ser al menos 1."
+
+    resultado = mmck_metrics(lambd, mu, 1, K, n_max)
+    del resultado["c_bar (servidores ocupados)"]
+    return resultado
+
+# ====================================================================================================
+# MODELO MMcK METRICAS (CAPACIDAD FINITA)
+# ====================================================================================================
+# A diferencia de mmc_metrics, funciona también con ρ ≥ 1 porque la capacidad K acota el sistema.
+def mmck_metrics(lambd, mu, s, K, n_max):
+    if K < s:
+        return "\nERROR: La capacidad K debe ser al menos el número de servidores c."
+
+    n = np.arange(K + 1)
+    tasas_llegada = np.full(K + 1, float(lambd))
+    tasas_servicio = mu * np.minimum(n[1:], s)
+    return _metricas_nacimiento_muerte(tasas_llegada, tasas_servicio, mu, s, n_max)
+
+# ====================================================================================================
+# MODELO MMc//N METRICAS (POBLACION FINITA)
+# ====================================================================================================
+# N clientes en total; cada uno que está fuera del sistema llega con tasa λ. Si se indica K < N, el
+# sistema además tiene capacidad finita y los clientes que llegan con el sistema lleno se bloquean.
+def mmc_poblacion_finita_metrics(lambd, mu, s, N, n_max, K=None):
+    K = N if K is None else min(K, N)
+    if K < s:
+        return "\nERROR: La capacidad K y la población N deben ser al menos el número de servidores c."
+
+    n = np.arange(K + 1)
+    tasas_llegada = lambd * (N - n).astype(float)
+    tasas_servicio = mu * np.minimum(n[1:], s)
+    return _metricas_nacimiento_muerte(tasas_llegada, tasas_servicio, mu, s, n_max)
+
+# ====================================================================================================
+# SOLUCIONADOR DE NACIMIENTO Y MUERTE
+# ====================================================================================================
+# nacimiento_muerte: Distribución estacionaria de un proceso de nacimiento y muerte con estados 0..K, donde
+# tasas_nacimiento[n] es la tasa de n a n+1 (n = 0..K-1) y tasas_muerte[n] la de n+1 a n. Usa el producto acumulado
+# P(n) ∝ Π λ_k / μ_{k+1} en espacio logarítmico, así que es O(K) y no se desborda aunque ρ ≥ 1 o K sea de 10^6.
+def nacimiento_muerte(tasas_nacimiento, tasas_muerte):
+    with np.errstate(divide="ignore"):
+        log_cocientes = np.log(np.asarray(tasas_nacimiento, dtype=float)) - np.log(np.asarray(tasas_muerte, dtype=float))
+
+    log_p = np.empty(len(log_cocientes) + 1)
+    log_p[0] = 0.0
+    np.cumsum(log_cocientes, out=log_p[1:])
+    p = np.exp(log_p - log_p.max())
+    return p / p.sum()
+
+# _metricas_nacimiento_muerte: Métricas con la misma forma que mmc_metrics más la probabilidad de bloqueo y la tasa
+# efectiva de llegada. tasas_llegada tiene K+1 valores: el último es la tasa con el sistema lleno (la que se bloquea).
+# Sin llegadas efectivas (λ = 0) se usa la misma convención que mmc_metrics: Ws = 1/μ y Wq = 0.
+def _metricas_nacimiento_muerte(tasas_llegada, tasas_servicio, mu, s, n_max):
+    p = nacimiento_muerte(tasas_llegada[:-1], tasas_servicio)
+    n = np.arange(len(p))
+
+    ofrecida = float(np.dot(tasas_llegada, p))
+    bloqueada = float(tasas_llegada[-1] * p[-1])
+    lambda_ef = ofrecida - bloqueada
+    P_bloqueo = bloqueada / ofrecida if ofrecida > 0 else 0.0
+
+    Ls = float(np.dot(n, p))
+    Lq = float(np.dot(np.maximum(n - s, 0), p))
+    c_bar = Ls - Lq
+    Ws = Ls / lambda_ef if lambda_ef > 0 else 1 / mu
+    Wq = Lq / lambda_ef if lambda_ef > 0 else 0.0
+
+    Pn = np.zeros(max(n_max + 1, 0))
+    Pn[:min(len(p), len(Pn))] = p[:len(Pn)]
+
+    return {
+        "rho (factor de uso)": c_bar / s,
+        "Ls (clientes esperados en el sistema)": Ls,
+        "Lq (clientes esperados en la cola)": Lq,
+        "Ws (tiempo esperado en el sistema)": Ws,
+        "Wq (tiempo esperado en la cola)": Wq,
+        "c_bar (servidores ocupados)": c_bar,
+        "P0 (probabilidad del sistema vacío)": float(p[0]),
+        "Pn": Pn.tolist(),
+        "P_bloqueo (probabilidad de bloqueo)": P_bloqueo,
+        "lambda_ef (tasa efectiva de llegada)": lambda_ef
+    }
+
+# ====================================================================================================
+# MODELO MM1 METRICAS EN LOTE (VECTORIZADO)
+# ====================================================================================================
+# Recibe arreglos de λ y μ (o escalares que se difunden entre sí) y regresa columnas con las mismas
+# métricas que mm1_metrics. Los puntos inestables (λ ≥ μ) se marcan en "estable" y quedan en NaN.
+def mm1_metrics_batch(lambd, mu, n_max):
+    lambd, mu = np.broadcast_arrays(np.asarray(lambd, dtype=float), np.asarray(mu, dtype=float))
+    estable = lambd < mu
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = np.where(estable, lambd / mu, np.nan)
+        Ls = rho / (1 - rho)
+        Lq = Ls - rho
+        Ws = np.where(estable, 1 / (mu - lambd), np.nan)
+        Wq = rho * Ws
+        P0 = 1 - rho
+        Pn = P0[..., None] * rho[..., None] ** np.arange(n_max + 1)
+
+    return {
+        "rho (factor de uso)": rho,
+        "Ls (clientes esperados en el sistema)": Ls,
+        "Lq (clientes esperados en la cola)": Lq,
+        "Ws (tiempo esperado en el sistema)": Ws,
+        "Wq (tiempo esperado en la cola)": Wq,
+        "P0 (probabilidad del sistema vacío)": P0,
+        "Pn": Pn,
+        "estable": estable
+    }
+
+# ====================================================================================================
+# MODELO MMc METRICAS EN LOTE (VECTORIZADO)
+# ====================================================================================================
+# Igual que mm1_metrics_batch pero con un arreglo de servidores. P0 y Pn se obtienen en espacio
+# logarítmico a partir de _log_erlang_batch, así que no hay desbordamientos ni subdesbordamientos.
+def mmc_metrics_batch(lambd, mu, s, n_max):
+    lambd, mu, s = np.broadcast_arrays(
+        np.asarray(lambd, dtype=float), np.asarray(mu, dtype=float), np.asarray(s, dtype=np.int64)
+    )
+    s_seguro = np.maximum(s, 1)
+    a = lambd / mu
+    rho = a / s_seguro
+    estable = (s >= 1) & (rho < 1)
+
+    log_suma, log_B = _log_erlang_batch(np.where(estable, s, 0), np.where(estable, a, 0.0))
+    B = np.exp(log_B)
+    log_fact = _log_factoriales(max(int(s_seguro.max(initial=1)), n_max))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = np.where(estable, rho, np.nan)
+        C = s * B / (s - a * (1 - B))
+        Lq = C * rho / (1 - rho)
+        Ls = Lq + a
+        Wq = np.where(estable, C / (s * mu - lambd), np.nan)
+        Ws = Wq + 1 / mu
+        c_bar = np.where(estable, a, np.nan)
+
+        # log P0 = -log(Σ_{k≤c} a^k/k!) - log(1 + B·ρ/(1-ρ)); log Σ viene en espacio logarítmico, así que B puede
+        # subdesbordarse a 0 sin que P0 y Pn se vuelvan 0.
+        log_a = np.log(a)
+        log_p0 = -log_suma - np.log1p(B * rho / (1 - rho))
+        P0 = np.exp(log_p0)
+
+        n = np.arange(n_max + 1)
+        k = np.minimum(n, s_seguro[..., None])
+        log_pn = (
+            log_p0[..., None]
+            + np.where(n == 0, 0.0, n * log_a[..., None])
+            - log_fact[k]
+            - (n - k) * np.log(s_seguro)[..., None]
+        )
+        Pn = np.exp(log_pn)
+
+    return {
+        "rho (factor de uso)": rho,
+        "Ls (clientes esperados en el sistema)": Ls,
+        "Lq (clientes esperados en la cola)": Lq,
+        "Ws (tiempo esperado en el sistema)": Ws,
+        "Wq (tiempo esperado en la cola)": Wq,
+        "c_bar (servidores ocupados)": c_bar,
+        "P0 (probabilidad del sistema vacío)": P0,
+        "Pn": Pn,
+        "estable": estable
+    }
+
+# _erlang_b_batch: Recurrencia B(k) = a·B(k-1) / (k + a·B(k-1)) aplicada a todos los puntos a la vez.
+# Se ordena por número de servidores para que en el paso k solo se actualicen los puntos con c ≥ k.
+# B puede subdesbordarse a 0 cuando a ≪ c; _log_erlang_batch cubre ese caso.
+def _erlang_b_batch(s, a):
+    forma = np.shape(a)
+    s = np.ravel(s)
+    a = np.ravel(a)
+    orden = np.argsort(s, kind="stable")
+    s_ord = s[orden]
+    a_ord = a[orden]
+    B = np.ones(a_ord.shape)
+
+    for k in range(1, int(s_ord[-1]) + 1 if s_ord.size else 1):
+        inicio = np.searchsorted(s_ord, k, side="left")
+        aB = a_ord[inicio:] * B[inicio:]
+        B[inicio:] = aB / (k + aB)
+
+    resultado = np.empty_like(B)
+    resultado[orden] = B
+    return resultado.reshape(forma)
+
+# _log_erlang_batch: Versión vectorizada de _log_erlang; regresa (log Σ_{k≤c} a^k/k!, log B). Usa la recurrencia
+# rápida de _erlang_b_batch y solo los puntos donde B es diminuto (o se subdesbordó) se recalculan con log-sum-exp.
+def _log_erlang_batch(s, a):
+    s, a = np.broadcast_arrays(np.asarray(s, dtype=np.int64), np.asarray(a, dtype=float))
+    forma = s.shape
+    s = s.ravel()
+    a = a.ravel()
+    log_fact = _log_factoriales(int(s.max(initial=0)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_a = np.log(a)
+        log_B = np.log(_erlang_b_batch(s, a))
+        diminuto = (log_B < -500) & (a > 0)
+        log_suma = np.where(a > 0, s * log_a - log_fact[s] - log_B, 0.0)
+
+    if diminuto.any():
+        s_d = s[diminuto]
+        log_suma[diminuto] = _log_suma_erlang_batch(s_d, a[diminuto], log_fact)
+        log_B[diminuto] = s_d * log_a[diminuto] - log_fact[s_d] - log_suma[diminuto]
+    return log_suma.reshape(forma), log_B.reshape(forma)
+
+# _log_suma_erlang_batch: log Σ_{k≤c} a^k/k! (a > 0) acumulando log-sum-exp de los términos k·log a - log k!.
+# Como en _log_erlang, si c ≥ a + 12·√a + 60 la suma es e^a y no hace falta recorrerla.
+def _log_suma_erlang_batch(s, a, log_fact):
+    log_suma = a.copy()
+    corta = s < a + 12 * np.sqrt(a) + 60
+    orden = np.flatnonzero(corta)[np.argsort(s[corta], kind="stable")]
+    s_ord = s[orden]
+    log_a = np.log(a[orden])
+    parcial = np.zeros(s_ord.shape)
+
+    for k in range(1, int(s_ord[-1]) + 1 if s_ord.size else 1):
+        inicio = np.searchsorted(s_ord, k, side="left")
+        np.logaddexp(parcial[inicio:], k * log_a[inicio:] - log_fact[k], out=parcial[inicio:])
+
+    log_suma[orden] = parcial
+    return log_suma
+
+# _log_factoriales: Tabla de log(k!) para k = 0..m usando sumas acumuladas de logaritmos.
+def _log_factoriales(m):
+    return np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, m + 1)))))
+
 # ====================================================================================================
 # GRAFICAR PROBABILIDADES N
 # ====================================================================================================
 def plot_probabilities(Pn):
+    import matplotlib.pyplot as plt
+
     plt.bar(range(len(Pn)), Pn, color='skyblue')
     plt.xlabel('n (número de clientes en el sistema)')
     plt.ylabel('Pₙ (probabilidad)')